@@ -1,190 +1,335 @@
 """
 Configuration Management for SavVio Data Pipeline
 Loads configuration from environment variables (.env file)
+
+Settings are resolved lazily on first access (e.g. `from config import
+GCS_BUCKET_NAME`) and cached for the rest of the process. Local data and
+log directories are not created on import; call ensure_dirs() instead.
+Settings are not validated on import either; the ingestion entrypoint
+calls validate_config().
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any, Callable, FrozenSet, List, Mapping, Optional, Tuple
 from dotenv import load_dotenv
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+@dataclass(frozen=True)
+class Config:
+    """Resolved pipeline configuration. Field names match the module attributes."""
+
+    # GCP Configuration
+    GCP_PROJECT_ID: Optional[str]
+    GCP_CREDENTIALS_PATH: Optional[str]
+
+    # GCS Storage Configuration
+    GCS_BUCKET_NAME: str
+    GCS_RAW_PATH: str
+    GCS_PROCESSED_PATH: str
+    GCS_FEATURES_PATH: str
+    GCS_VALIDATED_PATH: str
+    FINANCIAL_BLOB: str
+    PRODUCT_BLOB: str
+    REVIEW_BLOB: str
+
+    # Local File Paths
+    DATA_DIR: Path
+    RAW_DATA_DIR: Path
+    PROCESSED_DATA_DIR: Path
+    VALIDATED_DATA_DIR: Path
+    FEATURES_DATA_DIR: Path
+    TEMP_DATA_DIR: Path
+    FINANCIAL_RAW_PATH: str
+    PRODUCT_RAW_PATH: str
+    REVIEW_RAW_PATH: str
+    FINANCIAL_PARQUET_PATH: str
+    PRODUCT_PARQUET_PATH: str
+    REVIEW_PARQUET_PATH: str
+    FINANCIAL_FEATHER_PATH: str
+    PRODUCT_FEATHER_PATH: str
+    REVIEW_FEATHER_PATH: str
+
+    # API Configuration
+    API_BASE_URL: str
+    API_KEY: Optional[str]
+    API_TIMEOUT: int
+    FINANCIAL_API_ENDPOINT: str
+    PRODUCT_API_ENDPOINT: str
+    REVIEW_API_ENDPOINT: str
+
+    # Environment Configuration
+    ENVIRONMENT: str
+    DATA_SOURCE: str
+
+    # Pipeline Configuration
+    MAX_MISSING_VALUES_PCT: float
+    MIN_RECORDS_REQUIRED: int
+    MONTHLY_INCOME_COLS: Tuple[str, ...]      # Ordered, for iteration
+    MONTHLY_INCOME_COLS_SET: FrozenSet[str]   # For membership tests
+    MONTHLY_EXPENSE_COLS: Tuple[str, ...]
+    MONTHLY_EXPENSE_COLS_SET: FrozenSet[str]
+
+    # Logging Configuration
+    LOG_LEVEL: str
+    LOG_DIR: Path
+
+    # DVC Configuration
+    DVC_REMOTE_NAME: str
+    DVC_REMOTE_URL: str
+
+
+def _env(environ: Mapping[str, str], key: str, default: Any = None, cast: Callable = str):
+    """Read key from an environment snapshot, applying cast when a value is present."""
+    value = environ.get(key, default)
+    return cast(value) if value is not None else None
+
+
+def _split_cols(value: str) -> Tuple[str, ...]:
+    """Parse a comma-separated column list, stripping whitespace and blanks."""
+    return tuple(col for col in (c.strip() for c in value.split(",")) if col)
+
+
+@lru_cache(maxsize=1)
+def _cfg() -> Config:
+    """
+    Load configuration from the environment.
+    Runs once per process; subsequent calls return the cached Config.
 
-# Load environment variables from .env file
-# This will only work if .env exists (local development)
-# In production/Airflow, environment variables are set directly
-load_dotenv()
-
-
-# ============================================================================
-# GCP Configuration
-# ============================================================================
-
-GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID")
-GCP_CREDENTIALS_PATH = os.getenv("GCP_CREDENTIALS_PATH")
+    Returns:
+        Config: Resolved configuration
+    """
+    # Load environment variables from .env file
+    # This will only work if .env exists (local development)
+    # In production/Airflow, environment variables are set directly
+    load_dotenv()
 
-# Validate GCP credentials path if provided
-if GCP_CREDENTIALS_PATH and not os.path.exists(GCP_CREDENTIALS_PATH):
-    raise FileNotFoundError(
-        f"GCP credentials file not found: {GCP_CREDENTIALS_PATH}"
-    )
+    # Read everything from one snapshot instead of a getenv() call per setting
+    env = partial(_env, os.environ.copy())
 
+    # ========================================================================
+    # GCP Configuration
+    # ========================================================================
 
-# ============================================================================
-# GCS Storage Configuration
-# ============================================================================
+    gcp_credentials_path = env("GCP_CREDENTIALS_PATH")
 
-GCS_BUCKET_NAME = os.getenv("GCS_BUCKET_NAME", "savvio-data-bucket")
-
-# GCS folder paths
-GCS_RAW_PATH = os.getenv("GCS_RAW_PATH", "raw/")
-GCS_PROCESSED_PATH = os.getenv("GCS_PROCESSED_PATH", "processed/")
-GCS_FEATURES_PATH = os.getenv("GCS_FEATURES_PATH", "features/")
-GCS_VALIDATED_PATH = os.getenv("GCS_VALIDATED_PATH", "validated/")
-
-# Specific blob paths for each dataset
-FINANCIAL_BLOB = os.getenv("FINANCIAL_BLOB", "raw/financial_data.csv")
-PRODUCT_BLOB = os.getenv("PRODUCT_BLOB", "raw/product_data.json")
-REVIEW_BLOB = os.getenv("REVIEW_BLOB", "raw/review_data.json")
+    # Validate GCP credentials path if provided
+    if gcp_credentials_path and not os.path.exists(gcp_credentials_path):
+        raise FileNotFoundError(
+            f"GCP credentials file not found: {gcp_credentials_path}"
+        )
 
+    # ========================================================================
+    # GCS Storage Configuration
+    # ========================================================================
+
+    gcs_bucket_name = env("GCS_BUCKET_NAME", "savvio-data-bucket")
+
+    # ========================================================================
+    # Local File Paths
+    # ========================================================================
+
+    # Base directory for data storage
+    data_dir = env("DATA_DIR", "data", Path)
+    raw_data_dir = data_dir / "raw"
+
+    # ========================================================================
+    # API Configuration (for production)
+    # ========================================================================
+
+    api_base_url = env("API_BASE_URL", "https://api.savvio.com/v1")
+
+    # ========================================================================
+    # Pipeline Configuration
+    # ========================================================================
+
+    # Feature engineering parameters
+    monthly_income_cols = env("MONTHLY_INCOME_COLS", "income,salary", _split_cols)
+    monthly_expense_cols = env("MONTHLY_EXPENSE_COLS", "rent,bills,subscriptions", _split_cols)
+
+    # ========================================================================
+    # Environment Configuration
+    # ========================================================================
+
+    environment = env("ENVIRONMENT", "dev")  # dev, staging, prod
+
+    # Determine data source based on environment
+    if environment == "dev":
+        data_source = "gcs"
+    elif environment == "prod":
+        data_source = "api"
+    else:
+        data_source = env("DATA_SOURCE", "gcs")
+
+    cfg = Config(
+        GCP_PROJECT_ID=env("GCP_PROJECT_ID"),
+        GCP_CREDENTIALS_PATH=gcp_credentials_path,
+
+        GCS_BUCKET_NAME=gcs_bucket_name,
+        # GCS folder paths
+        GCS_RAW_PATH=env("GCS_RAW_PATH", "raw/"),
+        GCS_PROCESSED_PATH=env("GCS_PROCESSED_PATH", "processed/"),
+        GCS_FEATURES_PATH=env("GCS_FEATURES_PATH", "features/"),
+        GCS_VALIDATED_PATH=env("GCS_VALIDATED_PATH", "validated/"),
+        # Specific blob paths for each dataset
+        FINANCIAL_BLOB=env("FINANCIAL_BLOB", "raw/financial_data.csv"),
+        PRODUCT_BLOB=env("PRODUCT_BLOB", "raw/product_data.json"),
+        REVIEW_BLOB=env("REVIEW_BLOB", "raw/review_data.json"),
+
+        DATA_DIR=data_dir,
+        # Subdirectories
+        RAW_DATA_DIR=raw_data_dir,
+        PROCESSED_DATA_DIR=data_dir / "processed",
+        VALIDATED_DATA_DIR=data_dir / "validated",
+        FEATURES_DATA_DIR=data_dir / "features",
+        TEMP_DATA_DIR=data_dir / "temp",
+        # Specific file paths
+        FINANCIAL_RAW_PATH=str(raw_data_dir / "financial_data.csv"),
+        PRODUCT_RAW_PATH=str(raw_data_dir / "product_data.json"),
+        REVIEW_RAW_PATH=str(raw_data_dir / "review_data.json"),
+        # Typed Parquet snapshots of the raw data, for downstream tasks
+        FINANCIAL_PARQUET_PATH=str(raw_data_dir / "financial_data.parquet"),
+        PRODUCT_PARQUET_PATH=str(raw_data_dir / "product_data.parquet"),
+        REVIEW_PARQUET_PATH=str(raw_data_dir / "review_data.parquet"),
+        # LZ4 Feather (Arrow IPC) files handed to downstream Airflow tasks
+        FINANCIAL_FEATHER_PATH=str(raw_data_dir / "financial_data.feather"),
+        PRODUCT_FEATHER_PATH=str(raw_data_dir / "product_data.feather"),
+        REVIEW_FEATHER_PATH=str(raw_data_dir / "review_data.feather"),
+
+        API_BASE_URL=api_base_url,
+        API_KEY=env("API_KEY"),
+        API_TIMEOUT=env("API_TIMEOUT", 30, int),
+        # API endpoints
+        FINANCIAL_API_ENDPOINT=env("FINANCIAL_API_ENDPOINT", f"{api_base_url}/financial"),
+        PRODUCT_API_ENDPOINT=env("PRODUCT_API_ENDPOINT", f"{api_base_url}/products"),
+        REVIEW_API_ENDPOINT=env("REVIEW_API_ENDPOINT", f"{api_base_url}/reviews"),
+
+        ENVIRONMENT=environment,
+        DATA_SOURCE=data_source,
+
+        # Data validation thresholds
+        MAX_MISSING_VALUES_PCT=env("MAX_MISSING_VALUES_PCT", 0.1, float),  # 10%
+        MIN_RECORDS_REQUIRED=env("MIN_RECORDS_REQUIRED", 100, int),
+        # Feature engineering parameters
+        MONTHLY_INCOME_COLS=monthly_income_cols,
+        MONTHLY_INCOME_COLS_SET=frozenset(monthly_income_cols),
+        MONTHLY_EXPENSE_COLS=monthly_expense_cols,
+        MONTHLY_EXPENSE_COLS_SET=frozenset(monthly_expense_cols),
+
+        LOG_LEVEL=env("LOG_LEVEL", "INFO"),
+        LOG_DIR=env("LOG_DIR", "logs", Path),
+
+        DVC_REMOTE_NAME=env("DVC_REMOTE_NAME", "gcs"),
+        DVC_REMOTE_URL=env("DVC_REMOTE_URL", f"gs://{gcs_bucket_name}/dvc-store"),
+    )
 
-# ============================================================================
-# Local File Paths
-# ============================================================================
+    return cfg
 
-# Base directory for data storage
-DATA_DIR = Path(os.getenv("DATA_DIR", "data"))
 
-# Subdirectories
-RAW_DATA_DIR = DATA_DIR / "raw"
-PROCESSED_DATA_DIR = DATA_DIR / "processed"
-VALIDATED_DATA_DIR = DATA_DIR / "validated"
-FEATURES_DATA_DIR = DATA_DIR / "features"
-TEMP_DATA_DIR = DATA_DIR / "temp"
+def __getattr__(name: str):
+    """Resolve module-level settings (PEP 562) from the cached Config."""
+    if name in Config.__dataclass_fields__:
+        return getattr(_cfg(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Create directories if they don't exist
-for directory in [RAW_DATA_DIR, PROCESSED_DATA_DIR, VALIDATED_DATA_DIR, 
-                  FEATURES_DATA_DIR, TEMP_DATA_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
 
-# Specific file paths
-FINANCIAL_RAW_PATH = str(RAW_DATA_DIR / "financial_data.csv")
-PRODUCT_RAW_PATH = str(RAW_DATA_DIR / "product_data.json")
-REVIEW_RAW_PATH = str(RAW_DATA_DIR / "review_data.json")
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(Config.__dataclass_fields__))
 
 
 # ============================================================================
-# API Configuration (for production)
+# Local Directories
 # ============================================================================
 
-API_BASE_URL = os.getenv("API_BASE_URL", "https://api.savvio.com/v1")
-API_KEY = os.getenv("API_KEY")
-API_TIMEOUT = int(os.getenv("API_TIMEOUT", "30"))
-
-# API endpoints
-FINANCIAL_API_ENDPOINT = os.getenv("FINANCIAL_API_ENDPOINT", f"{API_BASE_URL}/financial")
-PRODUCT_API_ENDPOINT = os.getenv("PRODUCT_API_ENDPOINT", f"{API_BASE_URL}/products")
-REVIEW_API_ENDPOINT = os.getenv("REVIEW_API_ENDPOINT", f"{API_BASE_URL}/reviews")
-
-
-# ============================================================================
-# Environment Configuration
-# ============================================================================
-
-ENVIRONMENT = os.getenv("ENVIRONMENT", "dev")  # dev, staging, prod
-
-# Determine data source based on environment
-if ENVIRONMENT == "dev":
-    DATA_SOURCE = "gcs"
-elif ENVIRONMENT == "prod":
-    DATA_SOURCE = "api"
-else:
-    DATA_SOURCE = os.getenv("DATA_SOURCE", "gcs")
+def ensure_dirs():
+    """
+    Create local data and log directories if they don't exist.
+    Called by the ingestion entrypoint rather than at import time.
+    """
+    cfg = _cfg()
+    for directory in [cfg.RAW_DATA_DIR, cfg.PROCESSED_DATA_DIR, cfg.VALIDATED_DATA_DIR,
+                      cfg.FEATURES_DATA_DIR, cfg.TEMP_DATA_DIR, cfg.LOG_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
 
 
 # ============================================================================
-# Pipeline Configuration
+# Configuration Validation
 # ============================================================================
 
-# Data validation thresholds
-MAX_MISSING_VALUES_PCT = float(os.getenv("MAX_MISSING_VALUES_PCT", "0.1"))  # 10%
-MIN_RECORDS_REQUIRED = int(os.getenv("MIN_RECORDS_REQUIRED", "100"))
+class PipelineConfig(BaseModel):
+    """Validation rules for the settings the ingestion step depends on."""
 
-# Feature engineering parameters
-MONTHLY_INCOME_COLS = os.getenv("MONTHLY_INCOME_COLS", "income,salary").split(",")
-MONTHLY_EXPENSE_COLS = os.getenv("MONTHLY_EXPENSE_COLS", "rent,bills,subscriptions").split(",")
+    # Inputs are hidden from error messages so API_KEY never ends up in logs
+    model_config = ConfigDict(from_attributes=True, frozen=True, hide_input_in_errors=True)
 
+    ENVIRONMENT: str
+    DATA_SOURCE: str
+    GCS_BUCKET_NAME: Optional[str] = None
+    API_BASE_URL: Optional[str] = None
+    API_KEY: Optional[str] = Field(default=None, repr=False)
+    API_TIMEOUT: int = Field(gt=0)
+    MAX_MISSING_VALUES_PCT: float = Field(ge=0, le=1)
+    MIN_RECORDS_REQUIRED: int = Field(ge=0)
 
-# ============================================================================
-# Logging Configuration
-# ============================================================================
-
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_DIR = Path(os.getenv("LOG_DIR", "logs"))
-LOG_DIR.mkdir(parents=True, exist_ok=True)
-
+    @model_validator(mode="after")
+    def _check_required_for_source(self) -> "PipelineConfig":
+        errors = []
 
-# ============================================================================
-# DVC Configuration
-# ============================================================================
+        # Check required GCS configs for dev environment
+        if self.ENVIRONMENT == "dev" or self.DATA_SOURCE == "gcs":
+            if not self.GCS_BUCKET_NAME:
+                errors.append("GCS_BUCKET_NAME is required for GCS data source")
 
-DVC_REMOTE_NAME = os.getenv("DVC_REMOTE_NAME", "gcs")
-DVC_REMOTE_URL = os.getenv("DVC_REMOTE_URL", f"gs://{GCS_BUCKET_NAME}/dvc-store")
+        # Check required API configs for prod environment
+        if self.ENVIRONMENT == "prod" or self.DATA_SOURCE == "api":
+            if not self.API_BASE_URL:
+                errors.append("API_BASE_URL is required for API data source")
+            if not self.API_KEY:
+                errors.append("API_KEY is required for API data source")
 
+        if errors:
+            raise ValueError("; ".join(errors))
+        return self
 
-# ============================================================================
-# Configuration Validation
-# ============================================================================
 
-def validate_config():
+def validate_config() -> PipelineConfig:
     """
     Validate that required configuration values are set.
-    Raises ValueError if critical configs are missing.
+    Called explicitly by the ingestion entrypoint, not on import.
+
+    Returns:
+        PipelineConfig: The validated settings
+
+    Raises:
+        pydantic.ValidationError: (a ValueError) if critical configs are
+            missing or out of range
     """
-    errors = []
-    
-    # Check required GCS configs for dev environment
-    if ENVIRONMENT == "dev" or DATA_SOURCE == "gcs":
-        if not GCS_BUCKET_NAME:
-            errors.append("GCS_BUCKET_NAME is required for GCS data source")
-    
-    # Check required API configs for prod environment
-    if ENVIRONMENT == "prod" or DATA_SOURCE == "api":
-        if not API_BASE_URL:
-            errors.append("API_BASE_URL is required for API data source")
-        if not API_KEY:
-            errors.append("API_KEY is required for API data source")
-    
-    if errors:
-        raise ValueError(
-            "Configuration validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
-        )
+    return PipelineConfig.model_validate(_cfg())
 
 
 def get_config_summary() -> dict:
     """
     Get a summary of current configuration (for logging/debugging).
     Excludes sensitive information like API keys.
-    
+
     Returns:
         dict: Configuration summary
     """
+    cfg = _cfg()
     return {
-        "environment": ENVIRONMENT,
-        "data_source": DATA_SOURCE,
-        "gcp_project": GCP_PROJECT_ID,
-        "gcs_bucket": GCS_BUCKET_NAME,
-        "api_base_url": API_BASE_URL,
-        "log_level": LOG_LEVEL,
-        "data_dir": str(DATA_DIR),
+        "environment": cfg.ENVIRONMENT,
+        "data_source": cfg.DATA_SOURCE,
+        "gcp_project": cfg.GCP_PROJECT_ID,
+        "gcs_bucket": cfg.GCS_BUCKET_NAME,
+        "api_base_url": cfg.API_BASE_URL,
+        "log_level": cfg.LOG_LEVEL,
+        "data_dir": str(cfg.DATA_DIR),
     }
 
 
-# Run validation when module is imported
-try:
-    validate_config()
-except ValueError as e:
-    print(f"WARNING: {e}")
-    print("Some features may not work correctly.")
-
-
 # For debugging: print config when module is run directly
 if __name__ == "__main__":
     import json
@@ -192,4 +337,4 @@ if __name__ == "__main__":
     print("SavVio Configuration Summary")
     print("=" * 60)
     print(json.dumps(get_config_summary(), indent=2))
-    print("=" * 60)
\ No newline at end of file
+    print("=" * 60)
@@ -1,27 +1,190 @@
 """
 API Data Loader for SavVio Pipeline
 Handles fetching financial and product data from API endpoints.
-Supports pagination, rate limiting, and retry logic.
+Supports pagination, rate limiting, retry logic, and per-record
+JSON Schema validation.
 """
 
 import os
 import json
-import time
+import importlib.util
+import math
 import logging
-from typing import Optional, Dict, Any, List
+from itertools import islice
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable, List, Iterator, Tuple, Union
 from pathlib import Path
 import pandas as pd
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s'
+import httpx
+from tenacity import (
+    RetryCallState, Retrying, retry_if_exception, stop_after_attempt, wait_exponential
 )
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 logger = logging.getLogger(__name__)
 
+# Number of records serialized per write when saving JSON
+JSON_WRITE_CHUNK_SIZE = 10_000
+
+# Buffer size for output files; large buffers mean far fewer write syscalls
+# on network-backed disks (GCS FUSE, EBS, NFS)
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Response compression to request; httpx decodes these transparently, 'br' needs brotli
+ACCEPT_ENCODING = 'gzip, deflate, br' if importlib.util.find_spec('brotli') else 'gzip, deflate'
+
+# HTTP status codes that trigger a retry
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Status codes whose Retry-After header is honored, and the longest wait accepted
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+MAX_RETRY_AFTER = 60.0
+
+# Sidecar file next to a saved dataset holding its ETag/Last-Modified validators
+META_SUFFIX = ".meta.json"
+
+
+# JSON Schemas for records, keyed by endpoint resource (last path segment)
+SCHEMA_DIR = Path(__file__).parent / "schemas"
+SCHEMAS = {
+    "financial": SCHEMA_DIR / "financial.json",
+    "products": SCHEMA_DIR / "product.json",
+    "reviews": SCHEMA_DIR / "review.json",
+}
+
+
+def _compile_schema(path: Path) -> Callable[[Any], Any]:
+    """
+    Compile a JSON Schema file into a record validator.
+    
+    Uses fastjsonschema, which generates a Python function for the schema,
+    and falls back to a jsonschema validator if it isn't installed.
+    """
+    with open(path) as f:
+        schema = json.load(f)
+    if fastjsonschema is not None:
+        return fastjsonschema.compile(schema)
+    
+    import jsonschema
+    return jsonschema.Draft7Validator(schema).validate
+
+
+# Compiled once at import and reused for every record
+_VALIDATORS = {resource: _compile_schema(path) for resource, path in SCHEMAS.items()}
+
+
+def _validate_records(endpoint: str, records: List[Dict[str, Any]]) -> None:
+    """Validate records against the schema for endpoint, if one is defined."""
+    validate = _VALIDATORS.get(endpoint.rstrip('/').rsplit('/', 1)[-1])
+    if validate is None:
+        return
+    for record in records:
+        validate(record)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry on network errors/timeouts and on RETRY_STATUS_CODES responses."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRY_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """
+    Seconds the server asked us to wait via Retry-After, if any.
+    
+    Only applies to 429/503 responses. Supports both the delay-seconds and
+    HTTP-date forms, capped at MAX_RETRY_AFTER.
+    """
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    if exc.response.status_code not in RETRY_AFTER_STATUS_CODES:
+        return None
+    
+    value = exc.response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
+_backoff = wait_exponential(multiplier=1)  # Wait 1, 2, 4 seconds between retries
+
+
+def _wait_before_retry(retry_state: RetryCallState) -> float:
+    """Wait as long as the server's Retry-After says, else back off exponentially."""
+    delay = _retry_after(retry_state.outcome.exception())
+    return delay if delay is not None else _backoff(retry_state)
+
+
+def _dump_record(record: Dict[str, Any]) -> bytes:
+    """Serialize a single record to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(record, separators=(',', ':')).encode('utf-8')
+
+
+def _load_record(line: bytes) -> Dict[str, Any]:
+    """Parse a single NDJSON line written by _dump_record."""
+    return orjson.loads(line) if orjson is not None else json.loads(line)
+
+
+def _records_to_arrow(records: List[Dict[str, Any]]) -> Optional["pa.RecordBatch"]:
+    """
+    Convert records to a columnar Arrow RecordBatch.
+    
+    The schema is inferred across all records in C++. Arrow sorts struct
+    fields by name, so columns are put back in first-seen key order to
+    match pd.DataFrame(records). Returns None when pyarrow isn't installed
+    or the records can't be typed by Arrow (e.g. mixed-type fields), so
+    callers can fall back to pandas.
+    """
+    if pa is None or not records or not isinstance(records[0], dict):
+        return None
+    try:
+        batch = pa.RecordBatch.from_struct_array(pa.array(records))
+    except pa.ArrowException:
+        logger.debug("Records could not be converted to Arrow, using pandas")
+        return None
+    return batch.select(list(dict.fromkeys(key for record in records for key in record)))
+
+
+def _records_to_dataframe(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Build a DataFrame from a list of records.
+    
+    Goes through Arrow when possible, skipping pandas' per-field Python
+    type inference; falls back to pd.DataFrame otherwise.
+    """
+    batch = _records_to_arrow(records)
+    if batch is not None:
+        return batch.to_pandas(split_blocks=True, self_destruct=True)
+    return pd.DataFrame(records)
+
 
 class APILoader:
     """Handles data loading from REST API endpoints."""
@@ -46,34 +209,37 @@ class APILoader:
         self.api_key = api_key
         self.timeout = timeout
         
-        # Create session with retry strategy
-        self.session = requests.Session()
-        
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=1,  # Wait 1, 2, 4 seconds between retries
-            status_forcelist=[429, 500, 502, 503, 504],  # Retry on these HTTP codes
-            allowed_methods=["GET", "POST"]
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
         # Set default headers
-        self.session.headers.update({
+        headers = {
             'User-Agent': 'SavVio-Pipeline/1.0',
-            'Accept': 'application/json'
-        })
+            'Accept': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING
+        }
         
         # Add API key to headers if provided
         if self.api_key:
-            self.session.headers.update({
-                'Authorization': f'Bearer {self.api_key}'
-            })
+            headers['Authorization'] = f'Bearer {self.api_key}'
+        
+        # HTTP/2 client: concurrent page requests are multiplexed over one
+        # keep-alive connection. Pool sized for fetch_with_pagination_parallel.
+        self.client = httpx.Client(
+            timeout=self.timeout,
+            headers=headers,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            )
+        )
+        
+        # Configure retry strategy
+        self._retrying = Retrying(
+            stop=stop_after_attempt(max_retries + 1),
+            wait=_wait_before_retry,
+            retry=retry_if_exception(_is_retryable),
+            reraise=True
+        )
         
-        logger.info(f"API client initialized for {self.base_url}")
+        logger.info("API client initialized for %s", self.base_url)
     
     def _make_request(
         self,
@@ -95,56 +261,111 @@ class APILoader:
             dict: JSON response data
             
         Raises:
-            requests.exceptions.RequestException: If request fails
+            httpx.HTTPError: If request fails
+        """
+        response_data, _ = self._request(endpoint, method=method, params=params, data=data)
+        return response_data
+    
+    def _request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Any, httpx.Response]:
+        """
+        Make HTTP request to API endpoint, keeping the raw response.
+        
+        Same as _make_request, but also returns the response object so
+        callers can inspect headers such as X-Total-Count. Extra headers
+        (e.g. If-None-Match) are sent with this request only. A 304 Not
+        Modified response is returned with None as the data.
+        
+        Returns:
+            tuple: (JSON response data, httpx.Response)
         """
         url = f"{self.base_url}{endpoint}"
         
         try:
-            logger.info(f"Making {method} request to {url}")
-            
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data,
-                timeout=self.timeout
-            )
+            logger.debug("Making %s request to %s", method, url)
             
-            # Raise exception for bad status codes
-            response.raise_for_status()
+            response = self._retrying(self._send, method, url, params, data, headers)
+            
+            if response.status_code == 304:
+                logger.debug("Not modified: %s", url)
+                return None, response
             
             # Parse JSON response
             response_data = response.json()
             
-            logger.info(f"Request successful: {response.status_code}")
-            return response_data
+            logger.debug(
+                "Request successful: %d (%d bytes transferred, %d decoded)",
+                response.status_code, response.num_bytes_downloaded, len(response.content)
+            )
+            return response_data, response
             
-        except requests.exceptions.Timeout:
-            logger.error(f"Request timed out after {self.timeout} seconds")
+        except httpx.TimeoutException:
+            logger.error("Request timed out after %s seconds", self.timeout)
             raise
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error occurred: {e}")
-            logger.error(f"Response: {response.text}")
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error occurred: %s", e)
+            logger.error("Response: %s", e.response.text)
             raise
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
+        except httpx.HTTPError as e:
+            logger.error("Request failed: %s", e)
             raise
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.error(f"Response text: {response.text}")
+            logger.error("Failed to parse JSON response: %s", e)
+            logger.error("Response text: %s", response.text)
             raise
     
-    def fetch_with_pagination(
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """Send a single request attempt, raising on bad status codes other than 304."""
+        response = self.client.request(method, url, params=params, json=data, headers=headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+    
+    @staticmethod
+    def _extract_records(response_data: Any) -> List[Dict[str, Any]]:
+        """
+        Extract the list of records from an API response payload.
+        
+        Args:
+            response_data: Parsed JSON response
+            
+        Returns:
+            list: Records contained in the response
+        """
+        # Common patterns: response_data['data'], response_data['results'], or response_data itself
+        if isinstance(response_data, list):
+            return response_data
+        if 'data' in response_data:
+            return response_data['data']
+        if 'results' in response_data:
+            return response_data['results']
+        return [response_data]
+    
+    def _iter_pages(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         page_param: str = "page",
         limit_param: str = "limit",
         page_size: int = 100,
-        max_pages: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+        max_pages: Optional[int] = None,
+        first_page: Optional[Tuple[Any, httpx.Response]] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
-        Fetch data from paginated API endpoint.
+        Lazily fetch a paginated API endpoint, one page at a time.
         
         Args:
             endpoint: API endpoint
@@ -153,15 +374,17 @@ class APILoader:
             limit_param: Name of pagination limit parameter
             page_size: Number of records per page
             max_pages: Maximum number of pages to fetch (None for all)
+            first_page: (data, response) already fetched for page 1, used
+                instead of requesting it again
             
-        Returns:
-            list: All records from all pages
+        Yields:
+            list: Records from each page
         """
-        all_records = []
         page = 1
+        total = 0
         params = params or {}
         
-        logger.info(f"Fetching paginated data from {endpoint}")
+        logger.info("Fetching paginated data from %s", endpoint)
         
         while True:
             # Add pagination parameters
@@ -172,52 +395,194 @@ class APILoader:
             }
             
             try:
-                response_data = self._make_request(endpoint, params=page_params)
-                
-                # Extract records (adjust based on actual API response structure)
-                # Common patterns: response_data['data'], response_data['results'], or response_data itself
-                if isinstance(response_data, list):
-                    records = response_data
-                elif 'data' in response_data:
-                    records = response_data['data']
-                elif 'results' in response_data:
-                    records = response_data['results']
+                if page == 1 and first_page is not None:
+                    response_data, response = first_page
                 else:
-                    records = [response_data]
-                
-                if not records:
-                    logger.info(f"No more records found on page {page}")
-                    break
-                
-                all_records.extend(records)
-                logger.info(f"Fetched {len(records)} records from page {page} (total: {len(all_records)})")
-                
-                # Check if we should continue pagination
-                if max_pages and page >= max_pages:
-                    logger.info(f"Reached maximum pages limit: {max_pages}")
-                    break
-                
-                # Check if there are more pages (adjust based on API response)
+                    response_data, response = self._request(endpoint, params=page_params)
+                records = self._extract_records(response_data)
+                _validate_records(endpoint, records)
+            except Exception as e:
+                logger.error("Failed to fetch page %d: %s", page, e)
+                raise
+            
+            if not records:
+                logger.debug("No more records found on page %d", page)
+                break
+            
+            total += len(records)
+            logger.debug("Fetched %d records from page %d (total: %d)", len(records), page, total)
+            yield records
+            
+            # Check if we should continue pagination
+            if max_pages and page >= max_pages:
+                logger.info("Reached maximum pages limit: %d", max_pages)
+                break
+            
+            # Check if there are more pages (adjust based on API response).
+            # A short page is always the last; an RFC 8288 Link header is
+            # authoritative when present, saving the trailing empty-page fetch
+            if len(records) < page_size:
                 has_more = False
-                if isinstance(response_data, dict):
-                    has_more = response_data.get('has_more', False) or \
-                              response_data.get('hasMore', False) or \
-                              len(records) == page_size
-                
-                if not has_more:
-                    logger.info("No more pages available")
+            elif 'Link' in response.headers:
+                has_more = 'next' in response.links
+            else:
+                has_more = isinstance(response_data, dict) and (
+                    response_data.get('has_more', False) or
+                    response_data.get('hasMore', False) or
+                    len(records) == page_size
+                )
+            
+            if not has_more:
+                logger.debug("No more pages available")
+                break
+            
+            page += 1
+    
+    def fetch_with_pagination(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_param: str = "page",
+        limit_param: str = "limit",
+        page_size: int = 100,
+        max_pages: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch data from paginated API endpoint.
+        
+        Args:
+            endpoint: API endpoint
+            params: Additional query parameters
+            page_param: Name of pagination page parameter
+            limit_param: Name of pagination limit parameter
+            page_size: Number of records per page
+            max_pages: Maximum number of pages to fetch (None for all)
+            
+        Returns:
+            list: All records from all pages
+        """
+        all_records = []
+        for records in self._iter_pages(
+            endpoint,
+            params=params,
+            page_param=page_param,
+            limit_param=limit_param,
+            page_size=page_size,
+            max_pages=max_pages
+        ):
+            all_records.extend(records)
+        
+        logger.info("Total records fetched: %d", len(all_records))
+        return all_records
+    
+    @staticmethod
+    def _detect_total_pages(
+        response_data: Any,
+        response: httpx.Response,
+        page_size: int
+    ) -> Optional[int]:
+        """
+        Work out the total number of pages from a first-page response.
+        
+        Checks the X-Total-Count header, then 'total_pages'/'totalPages'/'pages'
+        and 'total'/'count' fields in the response body.
+        
+        Returns:
+            int or None: Total number of pages, or None if unknown
+        """
+        total_count = response.headers.get('X-Total-Count')
+        if total_count is None and isinstance(response_data, dict):
+            for key in ('total_pages', 'totalPages', 'pages'):
+                if isinstance(response_data.get(key), int):
+                    return response_data[key]
+            for key in ('total', 'count'):
+                if isinstance(response_data.get(key), int):
+                    total_count = response_data[key]
                     break
-                
-                page += 1
-                
-                # Rate limiting: small delay between requests
-                time.sleep(0.5)
-                
+        
+        if total_count is None:
+            return None
+        return math.ceil(int(total_count) / page_size)
+    
+    def fetch_with_pagination_parallel(
+        self,
+        endpoint: str,
+        total_pages: Optional[int] = None,
+        concurrency: int = 8,
+        params: Optional[Dict[str, Any]] = None,
+        page_param: str = "page",
+        limit_param: str = "limit",
+        page_size: int = 100,
+        max_pages: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch a paginated API endpoint with several pages in flight at once.
+        
+        The first page is fetched on its own to discover the total page count
+        (unless total_pages is given); the rest are fetched concurrently over
+        the shared client. Falls back to serial pagination, continuing from
+        the first page, when the total cannot be determined.
+        
+        Args:
+            endpoint: API endpoint
+            total_pages: Total number of pages (detected from the first page if None)
+            concurrency: Maximum number of requests in flight
+            params: Additional query parameters
+            page_param: Name of pagination page parameter
+            limit_param: Name of pagination limit parameter
+            page_size: Number of records per page
+            max_pages: Maximum number of pages to fetch (None for all)
+            
+        Returns:
+            list: All records from all pages, in page order
+        """
+        params = params or {}
+        
+        def fetch_page(page: int) -> Tuple[Any, httpx.Response]:
+            page_params = {**params, page_param: page, limit_param: page_size}
+            try:
+                return self._request(endpoint, params=page_params)
             except Exception as e:
-                logger.error(f"Failed to fetch page {page}: {e}")
+                logger.error("Failed to fetch page %d: %s", page, e)
                 raise
         
-        logger.info(f"Total records fetched: {len(all_records)}")
+        logger.info("Fetching paginated data from %s (concurrency: %d)", endpoint, concurrency)
+        
+        response_data, response = fetch_page(1)
+        
+        if total_pages is None:
+            total_pages = self._detect_total_pages(response_data, response, page_size)
+            if total_pages is None:
+                logger.warning("Total page count unknown, falling back to serial pagination")
+                all_records = []
+                for records in self._iter_pages(
+                    endpoint,
+                    params=params,
+                    page_param=page_param,
+                    limit_param=limit_param,
+                    page_size=page_size,
+                    max_pages=max_pages,
+                    first_page=(response_data, response)
+                ):
+                    all_records.extend(records)
+                logger.info("Total records fetched: %d", len(all_records))
+                return all_records
+        
+        all_records = list(self._extract_records(response_data))
+        _validate_records(endpoint, all_records)
+        
+        if max_pages:
+            total_pages = min(total_pages, max_pages)
+        
+        if total_pages > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                # map() yields results in page order
+                for page_data, _ in executor.map(fetch_page, range(2, total_pages + 1)):
+                    records = self._extract_records(page_data)
+                    _validate_records(endpoint, records)
+                    all_records.extend(records)
+        
+        logger.info("Total records fetched: %d from %d pages", len(all_records), total_pages)
         return all_records
     
     def save_to_file(
@@ -241,77 +606,358 @@ class APILoader:
             # Create directory if it doesn't exist
             Path(file_path).parent.mkdir(parents=True, exist_ok=True)
             
-            logger.info(f"Saving {len(data)} records to {file_path}")
+            logger.info("Saving %d records to %s", len(data), file_path)
             
             if format.lower() == 'json':
-                with open(file_path, 'w') as f:
-                    json.dump(data, f, indent=2)
+                self._write_json(data, file_path)
             elif format.lower() == 'csv':
-                df = pd.DataFrame(data)
-                df.to_csv(file_path, index=False)
+                self._write_csv(data, file_path)
             else:
                 raise ValueError(f"Unsupported format: {format}")
             
             file_size = os.path.getsize(file_path)
-            logger.info(f"Successfully saved {file_size} bytes to {file_path}")
+            logger.info("Successfully saved %d bytes to %s", file_size, file_path)
             
             return file_path
             
         except Exception as e:
-            logger.error(f"Failed to save data to file: {e}")
+            logger.error("Failed to save data to file: %s", e)
             raise
     
+    @staticmethod
+    def _write_json(data: List[Dict[str, Any]], file_path: str) -> None:
+        """
+        Write records to a newline-delimited JSON (NDJSON) file.
+        
+        One record per line, so the file can be read back with pandas'
+        C line parser (see read_saved). Records are serialized in chunks
+        of JSON_WRITE_CHUNK_SIZE so one giant bytes object is never built.
+        
+        Args:
+            data: Records to write
+            file_path: Destination file path
+        """
+        with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            for start in range(0, len(data), JSON_WRITE_CHUNK_SIZE):
+                chunk = data[start:start + JSON_WRITE_CHUNK_SIZE]
+                f.write(b''.join(_dump_record(row) + b'\n' for row in chunk))
+    
+    @staticmethod
+    def _write_csv(data: List[Dict[str, Any]], file_path: str) -> None:
+        """
+        Write records to a CSV file.
+        
+        Uses pyarrow's multi-threaded CSV writer straight from the records,
+        without a pandas intermediate. The header follows first-seen key
+        order, the same as pd.DataFrame(records) and the streaming writer.
+        Only the column order is shared: value formatting differs by
+        writer (Arrow quotes strings and writes true/false and 1 for 1.0;
+        pandas writes unquoted strings, True/False and 1.0).
+        Falls back to pandas when pyarrow is unavailable or the data has
+        columns Arrow can't write as CSV (nested lists/objects).
+        
+        Args:
+            data: Records to write
+            file_path: Destination file path
+        """
+        batch = _records_to_arrow(data)
+        if batch is not None:
+            try:
+                with pa.output_stream(file_path, buffer_size=WRITE_BUFFER_SIZE) as sink:
+                    pacsv.write_csv(
+                        batch, sink, write_options=pacsv.WriteOptions(include_header=True)
+                    )
+                return
+            except pa.ArrowException:
+                logger.debug("Arrow could not write CSV, using pandas")
+        
+        with open(file_path, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+            pd.DataFrame(data).to_csv(f, index=False)
+    
+    @staticmethod
+    def _read_validators(file_path: str, format: str) -> Dict[str, str]:
+        """
+        Build conditional request headers from a saved file's sidecar.
+        
+        Args:
+            file_path: Path of the previously saved file
+            format: Format the file is expected to be in
+            
+        Returns:
+            dict: If-None-Match/If-Modified-Since headers, empty if the
+                file or a matching sidecar doesn't exist
+        """
+        meta_path = f"{file_path}{META_SUFFIX}"
+        if not (os.path.exists(file_path) and os.path.exists(meta_path)):
+            return {}
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable metadata file %s: %s", meta_path, e)
+            return {}
+        if meta.get('path') != file_path or meta.get('format') != format:
+            return {}
+        
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    @staticmethod
+    def _write_validators(file_path: str, format: str, response: httpx.Response) -> None:
+        """
+        Record the response's ETag/Last-Modified next to the saved file.
+        
+        Removes any stale sidecar when the API sends neither header.
+        """
+        meta_path = f"{file_path}{META_SUFFIX}"
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            Path(meta_path).unlink(missing_ok=True)
+            return
+        with open(meta_path, 'w') as f:
+            json.dump({
+                'etag': etag,
+                'last_modified': last_modified,
+                'path': file_path,
+                'format': format
+            }, f)
+    
     def fetch_and_save(
         self,
         endpoint: str,
-        file_path: str,
+        file_path: Optional[str] = None,
         format: str = 'json',
         use_pagination: bool = True,
+        save: bool = True,
         **pagination_kwargs
     ) -> pd.DataFrame:
         """
         Fetch data from API and save to file, then return as DataFrame.
         
+        When saving a non-paginated response, its ETag/Last-Modified are
+        kept in a '<file_path>.meta.json' sidecar and sent back on the next
+        call. If the API answers 304 Not Modified, the download is skipped
+        and the previously saved file is loaded instead. Paginated fetches
+        are never conditional: a page's validator says nothing about
+        records that land on later pages.
+        
         Args:
             endpoint: API endpoint
-            file_path: Destination file path
+            file_path: Destination file path (required when save is True)
             format: File format ('json' or 'csv')
             use_pagination: Whether to use pagination
+            save: Whether to write the data to file_path. Pass False when
+                only the DataFrame is needed to skip the disk write entirely.
             **pagination_kwargs: Additional arguments for pagination
             
         Returns:
             pd.DataFrame: Fetched data
         """
+        if save and not file_path:
+            raise ValueError("file_path is required when save=True")
+        
+        format = format.lower()
+        
         try:
             if use_pagination:
-                data = self.fetch_with_pagination(endpoint, **pagination_kwargs)
+                data = []
+                for records in self._iter_pages(endpoint, **pagination_kwargs):
+                    data.extend(records)
+                logger.info("Total records fetched: %d", len(data))
             else:
-                response_data = self._make_request(endpoint)
+                conditional_headers = self._read_validators(file_path, format) if save else {}
+                response_data, response = self._request(endpoint, headers=conditional_headers)
+                if response.status_code == 304:
+                    logger.info("Reusing unchanged data from %s", file_path)
+                    return self.read_saved(file_path, format)
                 # Handle single object or list response
                 data = response_data if isinstance(response_data, list) else [response_data]
             
             # Save to file
-            self.save_to_file(data, file_path, format)
+            if save:
+                self.save_to_file(data, file_path, format)
+                if use_pagination:
+                    Path(f"{file_path}{META_SUFFIX}").unlink(missing_ok=True)
+                else:
+                    self._write_validators(file_path, format, response)
             
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
-            logger.info(f"Converted to DataFrame: {df.shape}")
+            # Convert to DataFrame from the records in hand, so the result
+            # doesn't depend on whether (or in which format) it was saved
+            df = _records_to_dataframe(data)
+            logger.info("Converted to DataFrame: %s", df.shape)
             
             return df
             
         except Exception as e:
-            logger.error(f"Failed to fetch and save data: {e}")
+            logger.error("Failed to fetch and save data: %s", e)
             raise
+    
+    def fetch_and_save_streaming(
+        self,
+        endpoint: str,
+        file_path: str,
+        format: str = 'json',
+        **pagination_kwargs
+    ) -> str:
+        """
+        Fetch a paginated endpoint and stream each page straight to disk.
+        
+        Only one page is held in memory at a time, so arbitrarily large
+        endpoints can be ingested. Use read_saved() to load the result.
+        
+        CSV needs its header up front, but fields may first appear on any
+        page, so pages are staged as NDJSON next to file_path and converted
+        once every column is known.
+        
+        Args:
+            endpoint: API endpoint
+            file_path: Destination file path
+            format: File format ('json' or 'csv')
+            **pagination_kwargs: Additional arguments for pagination
+            
+        Returns:
+            str: Path to saved file
+        """
+        format = format.lower()
+        if format not in ('json', 'csv'):
+            raise ValueError(f"Unsupported format: {format}")
+        
+        try:
+            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            
+            total = 0
+            pages = self._iter_pages(endpoint, **pagination_kwargs)
+            
+            if format == 'json':
+                with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    for records in pages:
+                        f.write(b''.join(_dump_record(row) + b'\n' for row in records))
+                        total += len(records)
+            else:
+                staging_path = f"{file_path}.ndjson.part"
+                columns: Dict[str, None] = {}  # Insertion-ordered set of keys
+                try:
+                    with open(staging_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                        for records in pages:
+                            columns.update(dict.fromkeys(key for row in records for key in row))
+                            f.write(b''.join(_dump_record(row) + b'\n' for row in records))
+                            total += len(records)
+                    self._ndjson_to_csv(staging_path, file_path, list(columns))
+                finally:
+                    Path(staging_path).unlink(missing_ok=True)
+            
+            file_size = os.path.getsize(file_path)
+            logger.info("Streamed %d records (%d bytes) to %s", total, file_size, file_path)
+            
+            return file_path
+            
+        except Exception as e:
+            logger.error("Failed to stream data to file: %s", e)
+            raise
+    
+    @staticmethod
+    def _ndjson_to_csv(src_path: str, file_path: str, columns: List[str]) -> None:
+        """
+        Convert an NDJSON file to CSV with the given header, JSON_WRITE_CHUNK_SIZE
+        records at a time; fields missing from a record are left empty.
+        """
+        with open(src_path, 'rb') as src, \
+                open(file_path, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+            header = True
+            while True:
+                records = [_load_record(line) for line in islice(src, JSON_WRITE_CHUNK_SIZE)]
+                if not records:
+                    break
+                pd.DataFrame(records, columns=columns).to_csv(f, header=header, index=False)
+                header = False
+    
+    @staticmethod
+    def read_saved(
+        file_path: str,
+        format: str = 'json',
+        chunksize: Optional[int] = None
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Load a file written by save_to_file or fetch_and_save_streaming.
+        
+        Args:
+            file_path: Path to saved file
+            format: File format ('json' for NDJSON, or 'csv')
+            chunksize: If set, return an iterator of DataFrames with this
+                many rows each instead of loading the whole file
+            
+        Returns:
+            pd.DataFrame or iterator of pd.DataFrame chunks. JSON values
+            are kept as parsed (no date or dtype inference), so the frame
+            matches pd.DataFrame(records) for the records that were saved.
+        """
+        format = format.lower()
+        if format == 'csv':
+            return pd.read_csv(file_path, chunksize=chunksize)
+        if format == 'json':
+            return pd.read_json(
+                file_path,
+                lines=True,
+                chunksize=chunksize,
+                convert_dates=False,
+                keep_default_dates=False,
+                dtype=False
+            )
+        raise ValueError(f"Unsupported format: {format}")
+
+
+def _configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure root logging for standalone runs.
+    
+    Not called on import, so the host application (e.g. Airflow) keeps
+    control of logging. Does nothing if the root logger is already set up.
+    """
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=level,
+            format='[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s'
+        )
 
 
 # Convenience functions for SavVio data pipeline
 
+@lru_cache(maxsize=8)
+def get_loader(
+    base_url: str,
+    api_key: Optional[str] = None,
+    timeout: int = 30
+) -> APILoader:
+    """
+    Get a shared APILoader for the given API settings.
+    
+    Loaders are cached so the load_*_data functions reuse one client,
+    and with it pooled connections and TLS sessions, instead of opening
+    new ones for every endpoint.
+    
+    Args:
+        base_url: Base URL for the API
+        api_key: API authentication key
+        timeout: Request timeout in seconds
+        
+    Returns:
+        APILoader: Cached loader instance
+    """
+    return APILoader(base_url=base_url, api_key=api_key, timeout=timeout)
+
+
 def load_financial_data(
     api_base_url: str,
     endpoint: str = "/financial",
     destination_path: str = "data/raw/financial_data.csv",
     api_key: Optional[str] = None,
-    timeout: int = 30
+    timeout: int = 30,
+    save: bool = True
 ) -> pd.DataFrame:
     """
     Load financial data from API endpoint.
@@ -322,6 +968,7 @@ def load_financial_data(
         destination_path: Local path to save data
         api_key: API authentication key
         timeout: Request timeout in seconds
+        save: Whether to save the data to destination_path
         
     Returns:
         pd.DataFrame: Financial data
@@ -330,7 +977,7 @@ def load_financial_data(
     logger.info("Loading Financial Data from API")
     logger.info("=" * 60)
     
-    loader = APILoader(base_url=api_base_url, api_key=api_key, timeout=timeout)
+    loader = get_loader(api_base_url, api_key, timeout)
     
     # Financial data is typically CSV format
     df = loader.fetch_and_save(
@@ -338,10 +985,11 @@ def load_financial_data(
         file_path=destination_path,
         format='csv',
         use_pagination=True,
+        save=save,
         page_size=100
     )
     
-    logger.info(f"Financial data loaded successfully: {df.shape}")
+    logger.info("Financial data loaded successfully: %s", df.shape)
     return df
 
 
@@ -350,7 +998,8 @@ def load_product_data(
     endpoint: str = "/products",
     destination_path: str = "data/raw/product_data.json",
     api_key: Optional[str] = None,
-    timeout: int = 30
+    timeout: int = 30,
+    save: bool = True
 ) -> pd.DataFrame:
     """
     Load product data from API endpoint.
@@ -361,6 +1010,7 @@ def load_product_data(
         destination_path: Local path to save data
         api_key: API authentication key
         timeout: Request timeout in seconds
+        save: Whether to save the data to destination_path
         
     Returns:
         pd.DataFrame: Product data
@@ -369,7 +1019,7 @@ def load_product_data(
     logger.info("Loading Product Data from API")
     logger.info("=" * 60)
     
-    loader = APILoader(base_url=api_base_url, api_key=api_key, timeout=timeout)
+    loader = get_loader(api_base_url, api_key, timeout)
     
     # Product data is JSON format
     df = loader.fetch_and_save(
@@ -377,10 +1027,11 @@ def load_product_data(
         file_path=destination_path,
         format='json',
         use_pagination=True,
+        save=save,
         page_size=100
     )
     
-    logger.info(f"Product data loaded successfully: {df.shape}")
+    logger.info("Product data loaded successfully: %s", df.shape)
     return df
 
 
@@ -389,7 +1040,8 @@ def load_review_data(
     endpoint: str = "/reviews",
     destination_path: str = "data/raw/review_data.json",
     api_key: Optional[str] = None,
-    timeout: int = 30
+    timeout: int = 30,
+    save: bool = True
 ) -> pd.DataFrame:
     """
     Load product review data from API endpoint.
@@ -400,6 +1052,7 @@ def load_review_data(
         destination_path: Local path to save data
         api_key: API authentication key
         timeout: Request timeout in seconds
+        save: Whether to save the data to destination_path
         
     Returns:
         pd.DataFrame: Review data
@@ -408,7 +1061,7 @@ def load_review_data(
     logger.info("Loading Product Review Data from API")
     logger.info("=" * 60)
     
-    loader = APILoader(base_url=api_base_url, api_key=api_key, timeout=timeout)
+    loader = get_loader(api_base_url, api_key, timeout)
     
     # Review data is JSON format
     df = loader.fetch_and_save(
@@ -416,15 +1069,18 @@ def load_review_data(
         file_path=destination_path,
         format='json',
         use_pagination=True,
+        save=save,
         page_size=100
     )
     
-    logger.info(f"Review data loaded successfully: {df.shape}")
+    logger.info("Review data loaded successfully: %s", df.shape)
     return df
 
 
 # Example usage and testing
 if __name__ == "__main__":
+    _configure_logging()
+    
     # This will be replaced by config.py in actual usage
     from dotenv import load_dotenv
     load_dotenv()
@@ -462,5 +1118,5 @@ if __name__ == "__main__":
         print(review_df.head())
         
     except Exception as e:
-        logger.error(f"Script execution failed: {e}")
+        logger.error("Script execution failed: %s", e)
         raise
\ No newline at end of file
@@ -4,27 +4,221 @@ Handles downloading and uploading financial and product data from/to Google Clou
 Supports both CSV and JSON formats.
 """
 
+import io
 import os
+import re
 import json
 import logging
-from typing import Optional, Union, Dict, Any
+import threading
+from functools import lru_cache
+from typing import Optional, Union, Dict, Any, BinaryIO, Iterator, List, Set, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
+import google.auth
+from google.api_core.exceptions import NotFound
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
 from google.oauth2 import service_account
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import google_crc32c
+    # 'python' means the C extension is missing and CRC32C runs in pure Python
+    FAST_CRC32C = google_crc32c.implementation == 'c'
+except ImportError:
+    FAST_CRC32C = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.json as pajson
+except ImportError:
+    pa = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# First non-whitespace byte, for sniffing file formats without copying
+_NON_SPACE = re.compile(rb'\S')
+
+# Default rows per chunk for the chunked readers
+DEFAULT_CHUNKSIZE = 500_000
+
+# Block size for pyarrow's CSV and JSON readers; each block is parsed on its
+# own thread (a JSON record must fit in one block)
+CSV_BLOCK_SIZE = 8 << 20
+JSON_BLOCK_SIZE = 8 << 20
+
+# Blobs/files at least this large are transferred as concurrent byte-range
+# slices instead of a single stream
+PARALLEL_TRANSFER_THRESHOLD = 64 * 1024 * 1024
+TRANSFER_CHUNK_SIZE = 32 * 1024 * 1024
+TRANSFER_MAX_WORKERS = 8
+
+# Write buffer for single-stream downloads. The client writes the response
+# in 8 KiB pieces; buffering turns those into a few large write() calls
+DOWNLOAD_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Keep-alive connections per host; covers TRANSFER_MAX_WORKERS plus the
+# concurrent dataset loads in run_ingestion (requests' default is 10)
+HTTP_POOL_SIZE = 16
+
+
+def _apply_dtype_hints(
+    df: pd.DataFrame,
+    categorical_cols: Optional[List[str]] = None,
+    downcast_floats: bool = False
+) -> pd.DataFrame:
+    """
+    Shrink a loaded DataFrame in place: low-cardinality columns become
+    categoricals, and float columns are downcast to float32 if requested.
+    """
+    for col in categorical_cols or ():
+        df[col] = df[col].astype('category')
+    
+    if downcast_floats:
+        for col, dtype in df.dtypes.items():
+            if pd.api.types.is_float_dtype(dtype):
+                df[col] = pd.to_numeric(df[col], downcast='float')
+    
+    return df
+
+
+def _is_ndjson(raw: bytes) -> bool:
+    """
+    Tell newline-delimited JSON from a JSON document by its first lines.
+    
+    NDJSON's first line is a complete JSON object and another non-empty
+    line follows; a pretty-printed document's first line isn't valid JSON
+    on its own. A single compact object, with or without a trailing
+    newline, is a JSON document: callers expecting records decide whether
+    to treat it as one.
+    """
+    start = _NON_SPACE.search(raw)
+    if start is None or raw[start.start():start.start() + 1] != b'{':
+        return False
+    newline = raw.find(b'\n', start.start())
+    if newline < 0 or _NON_SPACE.search(raw, newline + 1) is None:
+        return False
+    first_line = raw[start.start():newline]
+    try:
+        return isinstance(orjson.loads(first_line) if orjson else json.loads(first_line), dict)
+    except ValueError:
+        return False
+
+
+def _records_frame(data: Union[Dict[str, Any], pd.DataFrame], name: str) -> pd.DataFrame:
+    """
+    Normalize load_json_from_gcs output for a dataset of records. A single
+    JSON object, such as a one-record NDJSON file, is one record.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data
+    if isinstance(data, dict):
+        logger.info("%s JSON holds a single record", name)
+        return pd.DataFrame([data])
+    raise ValueError(f"{name} JSON must be a list of records")
+
+
+def _arrow_column_types(
+    dtypes: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Split pandas-style dtype hints into Arrow types for pyarrow's CSV reader
+    and the rest.
+    
+    Handles numpy dtypes, strings, 'category' (read as dictionary-encoded)
+    and Arrow-backed dtypes. Hints with no Arrow equivalent (e.g. 'Int64'
+    or a categorical with fixed categories) are returned separately, to be
+    applied with astype() after the read.
+    
+    Returns:
+        tuple: (column -> Arrow type, column -> remaining pandas dtype)
+    """
+    column_types, remaining = {}, {}
+    for col, hint in dtypes.items():
+        if isinstance(hint, pa.DataType):
+            column_types[col] = hint
+            continue
+        try:
+            dtype = pd.api.types.pandas_dtype(hint)
+        except TypeError:
+            remaining[col] = hint
+            continue
+        if isinstance(dtype, pd.ArrowDtype):
+            column_types[col] = dtype.pyarrow_dtype
+        elif isinstance(dtype, pd.CategoricalDtype):
+            if dtype.categories is None:
+                column_types[col] = pa.dictionary(pa.int32(), pa.string())
+            else:
+                remaining[col] = dtype
+        elif isinstance(dtype, pd.StringDtype) or dtype == object:
+            column_types[col] = pa.string()
+        elif isinstance(dtype, np.dtype):
+            column_types[col] = pa.from_numpy_dtype(dtype)
+        else:
+            remaining[col] = dtype
+    return column_types, remaining
+
+
+def _to_arrow_backed(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a numpy-backed DataFrame to Arrow-backed columns, keeping each
+    column's type. Columns Arrow can't type (e.g. mixed-type values) are
+    left as they are, as is everything if pyarrow isn't installed.
+    """
+    if pa is None:
+        return df
+    columns = {}
+    for col, series in df.items():
+        try:
+            array = pd.arrays.ArrowExtensionArray(pa.array(series, from_pandas=True))
+            columns[col] = pd.Series(array, index=df.index)
+        except pa.ArrowException:
+            columns[col] = series
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _arrow_to_pandas_dtype(arrow_type: Any) -> Optional[pd.ArrowDtype]:
+    """types_mapper for Table.to_pandas: Arrow-backed columns, except
+    dictionary columns, which stay pandas categoricals."""
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def _authorized_session(credentials: Any) -> AuthorizedSession:
+    """
+    Build the HTTP session for a storage client, as the client itself would,
+    but with a connection pool sized for concurrent requests.
+    
+    The pooled adapter is mounted before configure_mtls_channel(), so when
+    client certificates are enabled the mTLS adapter still takes over.
+    """
+    session = AuthorizedSession(credentials)
+    session.mount(
+        'https://',
+        HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    )
+    session.configure_mtls_channel()
+    return session
+
 
 class GCSLoader:
     """Handles data loading and uploading to/from Google Cloud Storage."""
     
-    def __init__(self, credentials_path: Optional[str] = None, project_id: Optional[str] = None):
+    def __init__(
+        self,
+        credentials_path: Optional[str] = None,
+        project_id: Optional[str] = None,
+        verify_checksums: bool = True
+    ):
         """
         Initialize GCS client.
         
@@ -32,25 +226,56 @@ class GCSLoader:
             credentials_path: Path to GCS service account JSON key file.
                             If None, uses Application Default Credentials (ADC).
             project_id: GCP project ID (optional, inferred from credentials if not provided)
+            verify_checksums: Verify downloads against the object's checksum.
+                            Can be disabled for trusted internal transfers.
         """
+        # Download checksum: CRC32C when the C extension is available, else
+        # MD5 (hashlib, also C); None skips verification
+        self.verify_checksums = verify_checksums
+        self._checksum = ('crc32c' if FAST_CRC32C else 'md5') if verify_checksums else None
+        # Sliced downloads can only be verified with CRC32C, which is too slow
+        # in pure Python; without the C extension they fall back to one MD5 stream
+        self._sliced_downloads = FAST_CRC32C or not verify_checksums
+        if not self._sliced_downloads:
+            logger.warning(
+                "google-crc32c C extension not available; "
+                "large downloads will use a single MD5-verified stream"
+            )
+        
+        # Blob name -> size listings from prefetch_blob_sizes, keyed by (bucket, prefix)
+        self._listings: Dict[Tuple[str, str], Dict[str, storage.Blob]] = {}
+        
+        # Local directories already created, so repeat downloads skip the mkdir
+        self._ensured_dirs: Set[Path] = set()
+        
         try:
             if credentials_path and os.path.exists(credentials_path):
                 credentials = service_account.Credentials.from_service_account_file(
-                    credentials_path
-                )
-                self.client = storage.Client(
-                    credentials=credentials,
-                    project=project_id
+                    credentials_path, scopes=storage.Client.SCOPE
                 )
-                logger.info(f"GCS client initialized with credentials from {credentials_path}")
+                source = f"credentials from {credentials_path}"
             else:
                 # Use Application Default Credentials (works in GCP environments)
-                self.client = storage.Client(project=project_id)
-                logger.info("GCS client initialized with Application Default Credentials")
+                credentials, _ = google.auth.default(scopes=storage.Client.SCOPE)
+                source = "Application Default Credentials"
+            
+            self.client = storage.Client(
+                credentials=credentials,
+                project=project_id,
+                _http=_authorized_session(credentials)
+            )
+            logger.info("GCS client initialized with %s", source)
         except Exception as e:
-            logger.error(f"Failed to initialize GCS client: {e}")
+            logger.error("Failed to initialize GCS client: %s", e)
             raise
     
+    def _ensure_parent_dir(self, path: str) -> None:
+        """Create the parent directory of path, once per directory per loader."""
+        parent = Path(path).parent
+        if parent not in self._ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent)
+    
     def download_blob(
         self, 
         bucket_name: str, 
@@ -74,33 +299,96 @@ class GCSLoader:
         """
         try:
             # Create destination directory if it doesn't exist
-            Path(destination_path).parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_parent_dir(destination_path)
             
-            # Get bucket and blob
-            bucket = self.client.bucket(bucket_name)
-            blob = bucket.blob(blob_name)
+            # Get the blob with its size and generation, from a prefetched
+            # listing if there is one, otherwise with a metadata request
+            # (None if the blob doesn't exist)
+            blob = self._listed_blob(bucket_name, blob_name)
+            if blob is None:
+                blob = self.client.bucket(bucket_name).get_blob(blob_name)
+                if blob is None:
+                    raise FileNotFoundError(
+                        f"Blob '{blob_name}' not found in bucket '{bucket_name}'"
+                    )
+            size = blob.size
             
-            # Check if blob exists
-            if not blob.exists():
-                raise FileNotFoundError(
-                    f"Blob '{blob_name}' not found in bucket '{bucket_name}'"
+            # Download the blob, in parallel slices if it is large
+            logger.info("Downloading gs://%s/%s (%d bytes) to %s", bucket_name, blob_name, size, destination_path)
+            if size >= PARALLEL_TRANSFER_THRESHOLD and self._sliced_downloads:
+                transfer_manager.download_chunks_concurrently(
+                    blob,
+                    destination_path,
+                    chunk_size=TRANSFER_CHUNK_SIZE,
+                    worker_type=transfer_manager.THREAD,
+                    max_workers=TRANSFER_MAX_WORKERS,
+                    crc32c_checksum=self.verify_checksums
                 )
-            
-            # Download the blob
-            logger.info(f"Downloading gs://{bucket_name}/{blob_name} to {destination_path}")
-            blob.download_to_filename(destination_path)
+            else:
+                try:
+                    with open(destination_path, 'wb', buffering=DOWNLOAD_BUFFER_SIZE) as f:
+                        blob.download_to_file(f, checksum=self._checksum)
+                except Exception:
+                    # Don't leave a partial file behind
+                    Path(destination_path).unlink(missing_ok=True)
+                    raise
             
             # Verify download
             if not os.path.exists(destination_path):
                 raise FileNotFoundError(f"Failed to download file to {destination_path}")
             
             file_size = os.path.getsize(destination_path)
-            logger.info(f"Successfully downloaded {file_size} bytes to {destination_path}")
+            logger.info("Successfully downloaded %d bytes to %s", file_size, destination_path)
             
             return destination_path
             
+        except NotFound:
+            # e.g. deleted after it was listed
+            logger.error("Failed to download blob: gs://%s/%s not found", bucket_name, blob_name)
+            raise FileNotFoundError(
+                f"Blob '{blob_name}' not found in bucket '{bucket_name}'"
+            ) from None
+        except Exception as e:
+            logger.error("Failed to download blob: %s", e)
+            raise
+    
+    def download_blob_as_bytes(self, bucket_name: str, blob_name: str) -> bytes:
+        """
+        Download a single blob from GCS bucket into memory.
+        
+        Args:
+            bucket_name: Name of the GCS bucket
+            blob_name: Path to the file in the bucket (e.g., 'raw/financial.csv')
+            
+        Returns:
+            bytes: Contents of the blob
+            
+        Raises:
+            FileNotFoundError: If blob doesn't exist
+            Exception: If download fails
+        """
+        try:
+            # Get bucket and blob. A missing blob surfaces as NotFound from the
+            # download itself, so there is no separate existence check; a
+            # prefetched listing lets us fail without any request
+            blob = self._listed_blob(bucket_name, blob_name)
+            if blob is None:
+                blob = self.client.bucket(bucket_name).blob(blob_name)
+            
+            # Download the blob
+            logger.info("Downloading gs://%s/%s into memory", bucket_name, blob_name)
+            data = blob.download_as_bytes(checksum=self._checksum)
+            logger.info("Successfully downloaded %d bytes", len(data))
+            
+            return data
+            
+        except NotFound:
+            logger.error("Failed to download blob: gs://%s/%s not found", bucket_name, blob_name)
+            raise FileNotFoundError(
+                f"Blob '{blob_name}' not found in bucket '{bucket_name}'"
+            ) from None
         except Exception as e:
-            logger.error(f"Failed to download blob: {e}")
+            logger.error("Failed to download blob: %s", e)
             raise
     
     def upload_blob(
@@ -141,24 +429,87 @@ class GCSLoader:
             
             # Upload the file
             file_size = os.path.getsize(source_path)
-            logger.info(f"Uploading {source_path} ({file_size} bytes) to gs://{bucket_name}/{destination_blob_name}")
+            logger.info("Uploading %s (%d bytes) to gs://%s/%s", source_path, file_size, bucket_name, destination_blob_name)
             
-            blob.upload_from_filename(source_path)
+            if file_size >= PARALLEL_TRANSFER_THRESHOLD:
+                # XML multipart upload, parts sent concurrently
+                transfer_manager.upload_chunks_concurrently(
+                    source_path,
+                    blob,
+                    content_type=content_type,
+                    chunk_size=TRANSFER_CHUNK_SIZE,
+                    worker_type=transfer_manager.THREAD,
+                    max_workers=TRANSFER_MAX_WORKERS
+                )
+            else:
+                blob.upload_from_filename(source_path)
             
             gcs_uri = f"gs://{bucket_name}/{destination_blob_name}"
-            logger.info(f"Successfully uploaded to {gcs_uri}")
+            logger.info("Successfully uploaded to %s", gcs_uri)
             
             return gcs_uri
             
         except Exception as e:
-            logger.error(f"Failed to upload blob: {e}")
+            logger.error("Failed to upload blob: %s", e)
             raise
     
+    def _fetch_source(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        destination_path: Optional[str]
+    ) -> Union[str, io.BytesIO]:
+        """
+        Download a blob for parsing: to destination_path if given, else into memory.
+        
+        Returns:
+            str or io.BytesIO: Local file path, or an in-memory buffer
+        """
+        if destination_path:
+            return self.download_blob(bucket_name, blob_name, destination_path)
+        return io.BytesIO(self.download_blob_as_bytes(bucket_name, blob_name))
+    
+    def _stream_source(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        destination_path: Optional[str]
+    ) -> Union[str, BinaryIO]:
+        """
+        Get a blob for chunked parsing: downloaded to destination_path if
+        given, else opened for streaming reads.
+        
+        A streamed blob is fetched in TRANSFER_CHUNK_SIZE ranged requests
+        as the parser consumes it, so the whole object is never held in
+        memory. Ranged reads can't be checked against the object's
+        checksum; pass destination_path when verification is required.
+        
+        Returns:
+            str or file object: Local file path, or a readable stream the
+                caller must close
+        """
+        if destination_path:
+            return self.download_blob(bucket_name, blob_name, destination_path)
+        
+        blob = self._listed_blob(bucket_name, blob_name)
+        if blob is None:
+            blob = self.client.bucket(bucket_name).get_blob(blob_name)
+        if blob is None:
+            raise FileNotFoundError(
+                f"Blob '{blob_name}' not found in bucket '{bucket_name}'"
+            )
+        logger.info("Streaming gs://%s/%s (%d bytes)", bucket_name, blob_name, blob.size)
+        return blob.open('rb', chunk_size=TRANSFER_CHUNK_SIZE)
+    
     def load_csv_from_gcs(
         self,
         bucket_name: str,
         blob_name: str,
-        destination_path: str
+        destination_path: Optional[str] = None,
+        chunksize: Optional[int] = None,
+        dtypes: Optional[Dict[str, Any]] = None,
+        categorical_cols: Optional[List[str]] = None,
+        downcast_floats: bool = False
     ) -> pd.DataFrame:
         """
         Download CSV from GCS and load into pandas DataFrame.
@@ -166,68 +517,244 @@ class GCSLoader:
         Args:
             bucket_name: Name of the GCS bucket
             blob_name: Path to the CSV file in the bucket
-            destination_path: Local path where file should be saved
+            destination_path: Local path where file should be saved. If None,
+                the blob is parsed in memory without writing a local copy.
+            chunksize: If set, parse this many rows at a time and concatenate,
+                which lowers the parser's peak memory on large files. Columns
+                are still Arrow-backed, but types are inferred by pandas
+                rather than pyarrow, so e.g. ISO dates stay strings instead
+                of date32; pass dtypes to pin such columns
+            dtypes: Column name -> dtype (e.g. {'amount': 'float32'}), parsed
+                directly instead of inferred
+            categorical_cols: Low-cardinality string columns to store as
+                pandas categoricals
+            downcast_floats: Downcast float64 columns to float32
             
         Returns:
             pd.DataFrame: Loaded data
         """
         try:
-            # Download the file
-            local_path = self.download_blob(bucket_name, blob_name, destination_path)
+            source = self._fetch_source(bucket_name, blob_name, destination_path)
+            logger.info("Loading CSV from %s", destination_path or f"gs://{bucket_name}/{blob_name}")
             
             # Load into DataFrame
-            logger.info(f"Loading CSV from {local_path}")
-            df = pd.read_csv(local_path)
+            if chunksize:
+                # Arrow-backed like the default path; types are inferred by pandas
+                kwargs = {'dtype_backend': 'pyarrow'} if pa is not None else {}
+                with pd.read_csv(source, chunksize=chunksize, dtype=dtypes, **kwargs) as reader:
+                    df = pd.concat(reader, ignore_index=True, copy=False)
+            else:
+                df = self._read_csv(source, dtypes)
+            
+            df = _apply_dtype_hints(df, categorical_cols, downcast_floats)
             
-            logger.info(f"Loaded {len(df)} rows and {len(df.columns)} columns")
-            logger.info(f"Columns: {list(df.columns)}")
+            logger.info("Loaded %d rows and %d columns", len(df), len(df.columns))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Columns: %s", list(df.columns))
             
             return df
             
         except Exception as e:
-            logger.error(f"Failed to load CSV from GCS: {e}")
+            logger.error("Failed to load CSV from GCS: %s", e)
             raise
     
     def load_json_from_gcs(
         self,
         bucket_name: str,
         blob_name: str,
-        destination_path: str
+        destination_path: Optional[str] = None,
+        lines: Optional[bool] = None
     ) -> Union[Dict[str, Any], pd.DataFrame]:
         """
         Download JSON from GCS and load into Python dict or DataFrame.
         
+        Accepts a JSON document or newline-delimited JSON (one record per
+        line, always returned as a DataFrame). Unless lines says otherwise,
+        the content is treated as NDJSON when its first line is a complete
+        JSON object and more lines follow (see _is_ndjson).
+        
         Args:
             bucket_name: Name of the GCS bucket
             blob_name: Path to the JSON file in the bucket
-            destination_path: Local path where file should be saved
+            destination_path: Local path where file should be saved. If None,
+                the blob is parsed in memory without writing a local copy.
+            lines: True for NDJSON, False for a JSON document, None to detect
             
         Returns:
             Dict or pd.DataFrame: Loaded data (DataFrame if JSON is list of records)
         """
         try:
-            # Download the file
-            local_path = self.download_blob(bucket_name, blob_name, destination_path)
+            if destination_path:
+                # Download the file
+                local_path = self.download_blob(bucket_name, blob_name, destination_path)
+                logger.info("Loading JSON from %s", local_path)
+                raw = Path(local_path).read_bytes()
+            else:
+                logger.info("Loading JSON from gs://%s/%s", bucket_name, blob_name)
+                raw = self.download_blob_as_bytes(bucket_name, blob_name)
             
-            # Load JSON
-            logger.info(f"Loading JSON from {local_path}")
-            with open(local_path, 'r') as f:
-                data = json.load(f)
+            if lines is None:
+                lines = _is_ndjson(raw)
+            if lines:
+                # Newline-delimited JSON (one record per line): parse column-wise
+                df = self._read_ndjson(raw)
+                logger.info("Loaded %d JSON lines records and %d columns", len(df), len(df.columns))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Columns: %s", list(df.columns))
+                return df
+            
+            # Load JSON (orjson when available)
+            data = orjson.loads(raw) if orjson else json.loads(raw)
             
             # If it's a list of records, convert to DataFrame
             if isinstance(data, list):
                 df = pd.DataFrame(data)
-                logger.info(f"Loaded {len(df)} records and {len(df.columns)} columns")
-                logger.info(f"Columns: {list(df.columns)}")
+                logger.info("Loaded %d records and %d columns", len(df), len(df.columns))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Columns: %s", list(df.columns))
                 return df
             else:
-                logger.info(f"Loaded JSON object with {len(data)} top-level keys")
+                logger.info("Loaded JSON object with %d top-level keys", len(data))
                 return data
             
         except Exception as e:
-            logger.error(f"Failed to load JSON from GCS: {e}")
+            logger.error("Failed to load JSON from GCS: %s", e)
             raise
     
+    @staticmethod
+    def _read_csv(
+        source: Union[str, io.BytesIO],
+        dtypes: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
+        """
+        Parse a whole CSV into a DataFrame.
+        
+        Uses pyarrow's multi-threaded reader, giving Arrow-backed columns
+        ('category' hints become pandas categoricals), and falls back to
+        pd.read_csv if pyarrow isn't installed or can't parse the file.
+        dtype hints Arrow can't parse directly are applied after the read.
+        """
+        if pa is None:
+            return pd.read_csv(source, dtype=dtypes)
+        
+        column_types, remaining = _arrow_column_types(dtypes or {})
+        try:
+            table = pacsv.read_csv(
+                source,
+                read_options=pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+                convert_options=pacsv.ConvertOptions(column_types=column_types)
+            )
+        except pa.ArrowInvalid as e:
+            logger.warning("pyarrow could not parse CSV, falling back to pandas: %s", e)
+            if isinstance(source, io.BytesIO):
+                source.seek(0)
+            return pd.read_csv(source, dtype=dtypes, dtype_backend='pyarrow')
+        
+        df = table.to_pandas(self_destruct=True, types_mapper=_arrow_to_pandas_dtype)
+        return df.astype(remaining) if remaining else df
+    
+    @staticmethod
+    def _read_ndjson(raw: bytes) -> pd.DataFrame:
+        """
+        Parse newline-delimited JSON into a DataFrame.
+        
+        Uses pyarrow's multi-threaded JSON reader, which builds Arrow
+        columns directly without a Python dict per record, and falls back
+        to pd.read_json(lines=True) if pyarrow isn't installed or can't
+        parse the data (e.g. a record larger than JSON_BLOCK_SIZE).
+        """
+        if pa is not None:
+            try:
+                table = pajson.read_json(
+                    io.BytesIO(raw),
+                    read_options=pajson.ReadOptions(use_threads=True, block_size=JSON_BLOCK_SIZE)
+                )
+                return table.to_pandas(self_destruct=True, types_mapper=pd.ArrowDtype)
+            except pa.ArrowInvalid as e:
+                logger.warning("pyarrow could not parse JSON lines, falling back to pandas: %s", e)
+        return pd.read_json(
+            io.BytesIO(raw),
+            lines=True,
+            convert_dates=False,
+            keep_default_dates=False,
+            dtype=False
+        )
+    
+    def iter_csv_from_gcs(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        destination_path: Optional[str] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Download CSV from GCS and yield it as DataFrames of chunksize rows.
+        
+        Only one chunk is parsed into memory at a time. Without a
+        destination_path the blob is streamed rather than downloaded, so
+        files larger than the worker's memory or disk can be processed.
+        
+        Args:
+            bucket_name: Name of the GCS bucket
+            blob_name: Path to the CSV file in the bucket
+            destination_path: Local path where file should be saved (None to
+                stream the blob instead)
+            chunksize: Number of rows per chunk
+            
+        Yields:
+            pd.DataFrame: Consecutive chunks of the file
+        """
+        source = self._stream_source(bucket_name, blob_name, destination_path)
+        kwargs = {'dtype_backend': 'pyarrow'} if pa is not None else {}
+        try:
+            with pd.read_csv(source, chunksize=chunksize, **kwargs) as reader:
+                yield from reader
+        finally:
+            if not isinstance(source, str):
+                source.close()
+    
+    def iter_json_from_gcs(
+        self,
+        bucket_name: str,
+        blob_name: str,
+        destination_path: Optional[str] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Download newline-delimited JSON (one record per line) from GCS and
+        yield it as DataFrames of chunksize records.
+        
+        Only one chunk is parsed into memory at a time; without a
+        destination_path the blob is streamed rather than downloaded.
+        
+        Args:
+            bucket_name: Name of the GCS bucket
+            blob_name: Path to the NDJSON file in the bucket
+            destination_path: Local path where file should be saved (None to
+                stream the blob instead)
+            chunksize: Number of records per chunk
+            
+        Yields:
+            pd.DataFrame: Consecutive chunks of the file
+        """
+        source = self._stream_source(bucket_name, blob_name, destination_path)
+        try:
+            # No date/dtype inference: values are kept as parsed, as in
+            # load_json_from_gcs (pandas' dtype_backend would turn 10.0 into an int)
+            with pd.read_json(
+                source,
+                lines=True,
+                chunksize=chunksize,
+                convert_dates=False,
+                keep_default_dates=False,
+                dtype=False
+            ) as reader:
+                for chunk in reader:
+                    yield _to_arrow_backed(chunk)
+        finally:
+            if not isinstance(source, str):
+                source.close()
+    
     def upload_dataframe(
         self,
         df: pd.DataFrame,
@@ -248,41 +775,93 @@ class GCSLoader:
             str: GCS URI of uploaded file
         """
         try:
-            # Create temporary local file
-            temp_dir = Path('data/temp')
-            temp_dir.mkdir(parents=True, exist_ok=True)
+            # Serialize in memory; no temp file on local disk
+            buffer = io.BytesIO()
             
             if format.lower() == 'csv':
-                temp_path = temp_dir / f"temp_{Path(destination_blob_name).name}"
-                df.to_csv(temp_path, index=False)
+                df.to_csv(buffer, index=False)
                 content_type = 'text/csv'
             elif format.lower() == 'json':
-                temp_path = temp_dir / f"temp_{Path(destination_blob_name).name}"
-                df.to_json(temp_path, orient='records', indent=2)
+                df.to_json(buffer, orient='records')
                 content_type = 'application/json'
             else:
                 raise ValueError(f"Unsupported format: {format}. Use 'csv' or 'json'")
             
-            logger.info(f"Saving DataFrame ({df.shape[0]} rows) as {format.upper()}")
+            logger.info("Saving DataFrame (%s rows) as %s", df.shape[0], format.upper())
             
             # Upload to GCS
-            gcs_uri = self.upload_blob(
-                bucket_name=bucket_name,
-                source_path=str(temp_path),
-                destination_blob_name=destination_blob_name,
-                content_type=content_type
-            )
+            size = buffer.getbuffer().nbytes
+            buffer.seek(0)
             
-            # Clean up temp file
-            temp_path.unlink()
-            logger.info(f"Cleaned up temporary file: {temp_path}")
+            bucket = self.client.bucket(bucket_name)
+            blob = bucket.blob(destination_blob_name)
+            
+            logger.info("Uploading %d bytes to gs://%s/%s", size, bucket_name, destination_blob_name)
+            blob.upload_from_file(buffer, size=size, content_type=content_type)
+            
+            gcs_uri = f"gs://{bucket_name}/{destination_blob_name}"
+            logger.info("Successfully uploaded to %s", gcs_uri)
             
             return gcs_uri
             
         except Exception as e:
-            logger.error(f"Failed to upload DataFrame: {e}")
+            logger.error("Failed to upload DataFrame: %s", e)
             raise
     
+    def prefetch_blob_sizes(self, bucket_name: str, prefix: str = "") -> Dict[str, int]:
+        """
+        List blob names and sizes under a prefix in one paged request.
+        
+        Later downloads of blobs under the prefix use the listed size and
+        generation instead of a per-blob metadata request (sliced downloads
+        need both), and blobs missing from it fail with FileNotFoundError
+        without a request. Downloads are pinned to the listed generation,
+        so a blob overwritten after the listing can't be read half old,
+        half new.
+        
+        Args:
+            bucket_name: Name of the GCS bucket
+            prefix: Prefix to list (e.g., 'raw/')
+            
+        Returns:
+            dict: Blob name -> size in bytes
+        """
+        try:
+            blobs = self.client.list_blobs(
+                bucket_name,
+                prefix=prefix or None,
+                fields='items(name,size,generation),nextPageToken'
+            )
+            listing = {blob.name: blob for blob in blobs}
+            self._listings[(bucket_name, prefix)] = listing
+            logger.info("Prefetched sizes of %d blobs in gs://%s/%s", len(listing), bucket_name, prefix)
+            
+            return {name: blob.size for name, blob in listing.items()}
+            
+        except Exception as e:
+            logger.error("Failed to list blobs: %s", e)
+            raise
+    
+    def _listed_blob(self, bucket_name: str, blob_name: str) -> Optional[storage.Blob]:
+        """
+        Look up a blob in the prefetched listings.
+        
+        Returns:
+            storage.Blob or None: The listed blob, with size and generation
+                set, or None if no listing covers blob_name
+            
+        Raises:
+            FileNotFoundError: If a listing covers blob_name but doesn't contain it
+        """
+        for (bucket, prefix), listing in self._listings.items():
+            if bucket == bucket_name and blob_name.startswith(prefix):
+                if blob_name not in listing:
+                    raise FileNotFoundError(
+                        f"Blob '{blob_name}' not found in bucket '{bucket_name}'"
+                    )
+                return listing[blob_name]
+        return None
+    
     def list_blobs(self, bucket_name: str, prefix: Optional[str] = None) -> list:
         """
         List all blobs in a bucket with optional prefix filter.
@@ -296,26 +875,68 @@ class GCSLoader:
         """
         try:
             bucket = self.client.bucket(bucket_name)
-            blobs = bucket.list_blobs(prefix=prefix)
+            blobs = bucket.list_blobs(prefix=prefix, fields='items(name),nextPageToken')
             
             blob_names = [blob.name for blob in blobs]
-            logger.info(f"Found {len(blob_names)} blobs in gs://{bucket_name}/{prefix or ''}")
+            logger.info("Found %d blobs in gs://%s/%s", len(blob_names), bucket_name, prefix or '')
             
             return blob_names
             
         except Exception as e:
-            logger.error(f"Failed to list blobs: {e}")
+            logger.error("Failed to list blobs: %s", e)
             raise
 
 
 # Convenience functions for SavVio data pipeline
 
+# lru_cache doesn't serialize misses, so concurrent first calls from
+# worker threads would each build their own client without this
+_loader_lock = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _cached_loader(
+    credentials_path: Optional[str],
+    project_id: Optional[str],
+    verify_checksums: bool
+) -> GCSLoader:
+    """Build the GCSLoader shared by get_loader()."""
+    return GCSLoader(credentials_path, project_id, verify_checksums)
+
+
+def get_loader(
+    credentials_path: Optional[str] = None,
+    project_id: Optional[str] = None,
+    verify_checksums: bool = True
+) -> GCSLoader:
+    """
+    Get a shared GCSLoader for the given credentials and project.
+    
+    Loaders are cached so the load_*_data functions reuse one storage
+    client, and with it parsed credentials and pooled connections. Safe
+    to call from several threads at once; only one loader is created.
+    
+    Args:
+        credentials_path: Optional path to service account credentials
+        project_id: Optional GCP project ID
+        verify_checksums: Verify downloads against the object's checksum
+        
+    Returns:
+        GCSLoader: Cached loader instance
+    """
+    with _loader_lock:
+        return _cached_loader(credentials_path, project_id, verify_checksums)
+
+
 def load_financial_data(
     bucket_name: str,
     blob_name: str,
-    destination_path: str = "data/raw/financial_data.csv",
+    destination_path: Optional[str] = "data/raw/financial_data.csv",
     credentials_path: Optional[str] = None,
-    project_id: Optional[str] = None
+    project_id: Optional[str] = None,
+    dtypes: Optional[Dict[str, Any]] = None,
+    categorical_cols: Optional[List[str]] = None,
+    downcast_floats: bool = False
 ) -> pd.DataFrame:
     """
     Load financial data (CSV) from GCS bucket.
@@ -323,9 +944,12 @@ def load_financial_data(
     Args:
         bucket_name: GCS bucket name
         blob_name: Path to financial data CSV in bucket
-        destination_path: Local destination path
+        destination_path: Local destination path (None to skip saving a local copy)
         credentials_path: Optional path to service account credentials
         project_id: Optional GCP project ID
+        dtypes: Column name -> dtype, parsed directly instead of inferred
+        categorical_cols: Low-cardinality string columns to store as categoricals
+        downcast_floats: Downcast float64 columns to float32
         
     Returns:
         pd.DataFrame: Financial data
@@ -334,17 +958,24 @@ def load_financial_data(
     logger.info("Loading Financial Data from GCS (CSV)")
     logger.info("=" * 60)
     
-    loader = GCSLoader(credentials_path, project_id)
-    df = loader.load_csv_from_gcs(bucket_name, blob_name, destination_path)
+    loader = get_loader(credentials_path, project_id)
+    df = loader.load_csv_from_gcs(
+        bucket_name,
+        blob_name,
+        destination_path,
+        dtypes=dtypes,
+        categorical_cols=categorical_cols,
+        downcast_floats=downcast_floats
+    )
     
-    logger.info(f"Financial data loaded successfully: {df.shape}")
+    logger.info("Financial data loaded successfully: %s", df.shape)
     return df
 
 
 def load_product_data(
     bucket_name: str,
     blob_name: str,
-    destination_path: str = "data/raw/product_data.json",
+    destination_path: Optional[str] = "data/raw/product_data.json",
     credentials_path: Optional[str] = None,
     project_id: Optional[str] = None
 ) -> pd.DataFrame:
@@ -354,7 +985,7 @@ def load_product_data(
     Args:
         bucket_name: GCS bucket name
         blob_name: Path to product data JSON in bucket
-        destination_path: Local destination path
+        destination_path: Local destination path (None to skip saving a local copy)
         credentials_path: Optional path to service account credentials
         project_id: Optional GCP project ID
         
@@ -365,21 +996,19 @@ def load_product_data(
     logger.info("Loading Product Data from GCS (JSON)")
     logger.info("=" * 60)
     
-    loader = GCSLoader(credentials_path, project_id)
-    data = loader.load_json_from_gcs(bucket_name, blob_name, destination_path)
+    loader = get_loader(credentials_path, project_id)
+    data = _records_frame(
+        loader.load_json_from_gcs(bucket_name, blob_name, destination_path), "Product"
+    )
     
-    # Ensure it's a DataFrame
-    if not isinstance(data, pd.DataFrame):
-        raise ValueError("Product JSON must be a list of records")
-    
-    logger.info(f"Product data loaded successfully: {data.shape}")
+    logger.info("Product data loaded successfully: %s", data.shape)
     return data
 
 
 def load_review_data(
     bucket_name: str,
     blob_name: str,
-    destination_path: str = "data/raw/review_data.json",
+    destination_path: Optional[str] = "data/raw/review_data.json",
     credentials_path: Optional[str] = None,
     project_id: Optional[str] = None
 ) -> pd.DataFrame:
@@ -389,7 +1018,7 @@ def load_review_data(
     Args:
         bucket_name: GCS bucket name
         blob_name: Path to review data JSON in bucket
-        destination_path: Local destination path
+        destination_path: Local destination path (None to skip saving a local copy)
         credentials_path: Optional path to service account credentials
         project_id: Optional GCP project ID
         
@@ -400,19 +1029,22 @@ def load_review_data(
     logger.info("Loading Product Review Data from GCS (JSON)")
     logger.info("=" * 60)
     
-    loader = GCSLoader(credentials_path, project_id)
-    data = loader.load_json_from_gcs(bucket_name, blob_name, destination_path)
-    
-    # Ensure it's a DataFrame
-    if not isinstance(data, pd.DataFrame):
-        raise ValueError("Review JSON must be a list of records")
+    loader = get_loader(credentials_path, project_id)
+    data = _records_frame(
+        loader.load_json_from_gcs(bucket_name, blob_name, destination_path), "Review"
+    )
     
-    logger.info(f"Review data loaded successfully: {data.shape}")
+    logger.info("Review data loaded successfully: %s", data.shape)
     return data
 
 
 # Example usage and testing
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s'
+    )
+    
     # This will be replaced by config.py in actual usage
     from dotenv import load_dotenv
     load_dotenv()
@@ -453,5 +1085,5 @@ if __name__ == "__main__":
         print(f"\nUploaded to: {gcs_uri}")
         
     except Exception as e:
-        logger.error(f"Script execution failed: {e}")
+        logger.error("Script execution failed: %s", e)
         raise
\ No newline at end of file
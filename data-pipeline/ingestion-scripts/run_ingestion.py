@@ -4,9 +4,13 @@ Routes data loading to appropriate source (GCS or API) based on environment conf
 This is the main entry point for the data ingestion step in the Airflow DAG.
 """
 
+import asyncio
 import logging
-from typing import Tuple
+from typing import Dict, List, Tuple
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 
 # Import configuration
 import sys
@@ -25,6 +29,12 @@ from config import (
     FINANCIAL_RAW_PATH,
     PRODUCT_RAW_PATH,
     REVIEW_RAW_PATH,
+    FINANCIAL_PARQUET_PATH,
+    PRODUCT_PARQUET_PATH,
+    REVIEW_PARQUET_PATH,
+    FINANCIAL_FEATHER_PATH,
+    PRODUCT_FEATHER_PATH,
+    REVIEW_FEATHER_PATH,
     GCP_CREDENTIALS_PATH,
     GCP_PROJECT_ID,
     API_BASE_URL,
@@ -33,14 +43,11 @@ from config import (
     FINANCIAL_API_ENDPOINT,
     PRODUCT_API_ENDPOINT,
     REVIEW_API_ENDPOINT,
-    get_config_summary
+    ensure_dirs,
+    get_config_summary,
+    validate_config
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +55,8 @@ def load_from_gcs() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Load all datasets from Google Cloud Storage.
     
+    The financial, product and review blobs are downloaded concurrently.
+    
     Returns:
         Tuple of (financial_df, product_df, review_df)
     """
@@ -56,47 +65,55 @@ def load_from_gcs() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     logger.info("=" * 80)
     
     # Import GCS loader
-    from ingest.gcs_loader import load_financial_data, load_product_data, load_review_data
+    from ingestion.gcs_loader import load_financial_data, load_product_data, load_review_data
     
-    try:
-        # Load financial data (CSV)
-        financial_df = load_financial_data(
-            bucket_name=GCS_BUCKET_NAME,
-            blob_name=FINANCIAL_BLOB,
-            destination_path=FINANCIAL_RAW_PATH,
-            credentials_path=GCP_CREDENTIALS_PATH,
-            project_id=GCP_PROJECT_ID
-        )
-        
-        # Load product data (JSON)
-        product_df = load_product_data(
-            bucket_name=GCS_BUCKET_NAME,
-            blob_name=PRODUCT_BLOB,
-            destination_path=PRODUCT_RAW_PATH,
-            credentials_path=GCP_CREDENTIALS_PATH,
-            project_id=GCP_PROJECT_ID
-        )
-        
-        # Load review data (JSON)
-        review_df = load_review_data(
-            bucket_name=GCS_BUCKET_NAME,
-            blob_name=REVIEW_BLOB,
-            destination_path=REVIEW_RAW_PATH,
-            credentials_path=GCP_CREDENTIALS_PATH,
-            project_id=GCP_PROJECT_ID
+    gcs_kwargs = {
+        'bucket_name': GCS_BUCKET_NAME,
+        'credentials_path': GCP_CREDENTIALS_PATH,
+        'project_id': GCP_PROJECT_ID
+    }
+    
+    async def _load_all() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        # The three downloads are independent and I/O-bound, so run them
+        # side by side; wall time is the slowest download, not the sum
+        return await asyncio.gather(
+            # Financial data (CSV)
+            asyncio.to_thread(
+                load_financial_data,
+                blob_name=FINANCIAL_BLOB,
+                destination_path=FINANCIAL_RAW_PATH,
+                **gcs_kwargs
+            ),
+            # Product data (JSON)
+            asyncio.to_thread(
+                load_product_data,
+                blob_name=PRODUCT_BLOB,
+                destination_path=PRODUCT_RAW_PATH,
+                **gcs_kwargs
+            ),
+            # Review data (JSON)
+            asyncio.to_thread(
+                load_review_data,
+                blob_name=REVIEW_BLOB,
+                destination_path=REVIEW_RAW_PATH,
+                **gcs_kwargs
+            )
         )
+    
+    try:
+        financial_df, product_df, review_df = asyncio.run(_load_all())
         
         logger.info("=" * 80)
         logger.info("GCS DATA LOADING COMPLETE")
-        logger.info(f"Financial records: {len(financial_df)}")
-        logger.info(f"Product records: {len(product_df)}")
-        logger.info(f"Review records: {len(review_df)}")
+        logger.info("Financial records: %d", len(financial_df))
+        logger.info("Product records: %d", len(product_df))
+        logger.info("Review records: %d", len(review_df))
         logger.info("=" * 80)
         
         return financial_df, product_df, review_df
         
     except Exception as e:
-        logger.error(f"Failed to load data from GCS: {e}")
+        logger.error("Failed to load data from GCS: %s", e)
         raise
 
 
@@ -112,7 +129,7 @@ def load_from_api() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     logger.info("=" * 80)
     
     # Import API loader
-    from ingest.api_loader import load_financial_data, load_product_data, load_review_data
+    from ingestion.api_loader import load_financial_data, load_product_data, load_review_data
     
     try:
         # Load financial data
@@ -144,25 +161,126 @@ def load_from_api() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         
         logger.info("=" * 80)
         logger.info("API DATA LOADING COMPLETE")
-        logger.info(f"Financial records: {len(financial_df)}")
-        logger.info(f"Product records: {len(product_df)}")
-        logger.info(f"Review records: {len(review_df)}")
+        logger.info("Financial records: %d", len(financial_df))
+        logger.info("Product records: %d", len(product_df))
+        logger.info("Review records: %d", len(review_df))
         logger.info("=" * 80)
         
         return financial_df, product_df, review_df
         
     except Exception as e:
-        logger.error(f"Failed to load data from API: {e}")
+        logger.error("Failed to load data from API: %s", e)
+        raise
+
+
+def _to_arrow_table(df: pd.DataFrame) -> pa.Table:
+    """
+    Convert a DataFrame to an Arrow table, coercing mixed-type columns.
+    
+    Object columns holding mixed types (e.g. 10 and 'N/A' from a JSON
+    payload) can't be typed by Arrow; those columns are converted to
+    strings, keeping missing values, instead of failing the whole task.
+    """
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except pa.ArrowException:
+        mixed = []
+        for col in df.columns[(df.dtypes == object).to_numpy()]:
+            try:
+                pa.array(df[col], from_pandas=True)
+            except pa.ArrowException:
+                mixed.append(col)
+        logger.warning("Writing mixed-type columns as strings: %s", mixed)
+        df = df.astype({col: 'string' for col in mixed})
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _save_dataset(
+    df: pd.DataFrame,
+    parquet_path: str,
+    feather_path: str
+) -> Tuple[str, Tuple[int, int]]:
+    """Write one dataset's Parquet snapshot and Feather hand-off file; return its path and shape."""
+    # Convert once and write both files from the same table
+    table = _to_arrow_table(df)
+    
+    pq.write_table(table, parquet_path, compression='snappy')
+    logger.info("Saved Parquet snapshot: %s", parquet_path)
+    
+    feather.write_feather(table, feather_path, compression='lz4')
+    logger.info("Saved hand-off file: %s", feather_path)
+    
+    return feather_path, df.shape
+
+
+def save_outputs(
+    financial_df: pd.DataFrame,
+    product_df: pd.DataFrame,
+    review_df: pd.DataFrame
+) -> Dict[str, Tuple[str, Tuple[int, int]]]:
+    """
+    Write each dataset as a Snappy Parquet snapshot and an LZ4 Feather
+    (Arrow IPC) hand-off file.
+    
+    The three datasets are written concurrently in worker threads; file
+    I/O is blocking, but pyarrow releases the GIL while encoding and
+    writing, so the writes overlap. Downstream tasks can read the typed,
+    columnar Parquet files instead of re-parsing the raw CSV/JSON, and
+    open the hand-off files with read_handoff().
+    
+    Returns:
+        dict: Dataset name -> (Feather hand-off file path, DataFrame shape)
+    """
+    async def _save_all() -> List[Tuple[str, Tuple[int, int]]]:
+        return await asyncio.gather(
+            asyncio.to_thread(_save_dataset, financial_df, FINANCIAL_PARQUET_PATH, FINANCIAL_FEATHER_PATH),
+            asyncio.to_thread(_save_dataset, product_df, PRODUCT_PARQUET_PATH, PRODUCT_FEATHER_PATH),
+            asyncio.to_thread(_save_dataset, review_df, REVIEW_PARQUET_PATH, REVIEW_FEATHER_PATH)
+        )
+    
+    try:
+        financial, product, review = asyncio.run(_save_all())
+        
+        return {
+            'financial': financial,
+            'product': product,
+            'review': review
+        }
+        
+    except Exception as e:
+        logger.error("Failed to save output files: %s", e)
         raise
 
 
-def run_ingestion() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+def read_handoff(path: str) -> pd.DataFrame:
+    """
+    Load a hand-off file written by run_ingestion.
+    
+    The file is memory-mapped, but hand-off files are LZ4-compressed, so
+    every column is still decompressed into memory on read. To get just
+    a dataset's shape, use the '*_shape' XComs instead of opening the file.
+    
+    Args:
+        path: Feather file path (e.g. from the '*_feather_path' XCom)
+        
+    Returns:
+        pd.DataFrame: The dataset
+    """
+    return feather.read_table(path, memory_map=True).to_pandas()
+
+
+def run_ingestion() -> Dict[str, Tuple[str, Tuple[int, int]]]:
     """
     Main ingestion function that routes to appropriate data source.
     This is the function called by Airflow DAG.
     
+    The loaded data is written to Feather hand-off files (and Parquet
+    snapshots) rather than returned, so no DataFrames are kept alive in
+    the task or passed through XCom.
+    
     Returns:
-        Tuple of (financial_df, product_df, review_df)
+        dict: Dataset name ('financial', 'product', 'review') ->
+            (hand-off file path, DataFrame shape)
         
     Raises:
         ValueError: If data source is not supported
@@ -176,10 +294,14 @@ def run_ingestion() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     logger.info("\nConfiguration:")
     config_summary = get_config_summary()
     for key, value in config_summary.items():
-        logger.info(f"  {key}: {value}")
+        logger.info("  %s: %s", key, value)
     
-    logger.info(f"\nEnvironment: {ENVIRONMENT}")
-    logger.info(f"Data Source: {DATA_SOURCE}")
+    logger.info("\nEnvironment: %s", ENVIRONMENT)
+    logger.info("Data Source: %s", DATA_SOURCE)
+    
+    # Fail fast on missing or invalid settings, then create local data/log directories
+    validate_config()
+    ensure_dirs()
     
     try:
         # Route to appropriate loader based on data source
@@ -201,16 +323,18 @@ def run_ingestion() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         if review_df.empty:
             logger.warning("Review data is empty!")
         
+        outputs = save_outputs(financial_df, product_df, review_df)
+        
         logger.info("\n" + "=" * 80)
         logger.info("DATA INGESTION SUCCESSFUL")
         logger.info("=" * 80)
         
-        return financial_df, product_df, review_df
+        return outputs
         
     except Exception as e:
         logger.error("\n" + "=" * 80)
         logger.error("DATA INGESTION FAILED")
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         logger.error("=" * 80)
         raise
 
@@ -225,38 +349,61 @@ def run_ingestion_task(**context):
     """
     try:
         # Run ingestion
-        financial_df, product_df, review_df = run_ingestion()
+        outputs = run_ingestion()
+        
+        # Shapes are recorded when the files are written, so nothing is re-read here
+        handoff_paths = {name: path for name, (path, _) in outputs.items()}
+        shapes = {name: shape for name, (_, shape) in outputs.items()}
         
         # Push data shapes to XCom for monitoring
         task_instance = context['ti']
-        task_instance.xcom_push(key='financial_shape', value=financial_df.shape)
-        task_instance.xcom_push(key='product_shape', value=product_df.shape)
-        task_instance.xcom_push(key='review_shape', value=review_df.shape)
+        task_instance.xcom_push(key='financial_shape', value=shapes['financial'])
+        task_instance.xcom_push(key='product_shape', value=shapes['product'])
+        task_instance.xcom_push(key='review_shape', value=shapes['review'])
         
         # Push file paths to XCom for downstream tasks
         task_instance.xcom_push(key='financial_path', value=FINANCIAL_RAW_PATH)
         task_instance.xcom_push(key='product_path', value=PRODUCT_RAW_PATH)
         task_instance.xcom_push(key='review_path', value=REVIEW_RAW_PATH)
         
+        # Parquet snapshots of the same data (faster to re-read)
+        task_instance.xcom_push(key='financial_parquet_path', value=FINANCIAL_PARQUET_PATH)
+        task_instance.xcom_push(key='product_parquet_path', value=PRODUCT_PARQUET_PATH)
+        task_instance.xcom_push(key='review_parquet_path', value=REVIEW_PARQUET_PATH)
+        
+        # Hand-off files; load with read_handoff()
+        task_instance.xcom_push(key='financial_feather_path', value=handoff_paths['financial'])
+        task_instance.xcom_push(key='product_feather_path', value=handoff_paths['product'])
+        task_instance.xcom_push(key='review_feather_path', value=handoff_paths['review'])
+        
         logger.info("Data paths pushed to XCom for downstream tasks")
         
         return {
-            'financial_records': len(financial_df),
-            'product_records': len(product_df),
-            'review_records': len(review_df),
+            'financial_records': shapes['financial'][0],
+            'product_records': shapes['product'][0],
+            'review_records': shapes['review'][0],
             'status': 'success'
         }
         
     except Exception as e:
-        logger.error(f"Ingestion task failed: {e}")
+        logger.error("Ingestion task failed: %s", e)
         raise
 
 
 # Standalone execution for testing
 if __name__ == "__main__":
+    # Configure logging here only; when run under Airflow its own logging setup applies
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s'
+    )
+    
     try:
         logger.info("Running data ingestion in standalone mode...")
-        financial_df, product_df, review_df = run_ingestion()
+        outputs = run_ingestion()
+        financial_df = read_handoff(outputs['financial'][0])
+        product_df = read_handoff(outputs['product'][0])
+        review_df = read_handoff(outputs['review'][0])
         
         print("\n" + "=" * 80)
         print("INGESTION SUMMARY")
@@ -281,7 +428,7 @@ if __name__ == "__main__":
         print("=" * 80)
         
     except Exception as e:
-        logger.error(f"Standalone execution failed: {e}")
+        logger.error("Standalone execution failed: %s", e)
         import traceback
         traceback.print_exc()
         exit(1)
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""
+Shared fixtures for the ingestion tests.
+"""
+
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Make the ingestion package importable, as run_ingestion does
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ingestion.api_loader import APILoader
+
+
+@pytest.fixture
+def api_loader():
+    """
+    Return a factory for an APILoader whose requests go to a handler
+    function (httpx.Request -> httpx.Response) instead of the network.
+    """
+    loaders = []
+
+    def make(handler):
+        loader = APILoader("http://api.test", max_retries=0)
+        loader.client = httpx.Client(transport=httpx.MockTransport(handler))
+        loaders.append(loader)
+        return loader
+
+    yield make
+
+    for loader in loaders:
+        loader.client.close()
@@ -0,0 +1,166 @@
+"""
+Tests for ingestion.gcs_loader, against in-memory blobs.
+"""
+
+import io
+import json
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from google.auth.credentials import AnonymousCredentials
+
+from ingestion import gcs_loader
+from ingestion.gcs_loader import GCSLoader, _arrow_column_types, _is_ndjson
+
+
+@pytest.fixture
+def loader():
+    """A GCSLoader whose storage client is a mock."""
+    with mock.patch("google.auth.default", return_value=(AnonymousCredentials(), None)), \
+            mock.patch.object(gcs_loader.storage, "Client"):
+        yield GCSLoader(project_id="test-project")
+
+
+def _serve_bytes(loader, data):
+    """Serve data for any blob, both as a whole download and as a stream."""
+    blob = mock.MagicMock(size=len(data))
+    blob.download_as_bytes.return_value = data
+    blob.open.side_effect = lambda *args, **kwargs: io.BytesIO(data)
+    bucket = loader.client.bucket.return_value
+    bucket.blob.return_value = blob
+    bucket.get_blob.return_value = blob
+    return blob
+
+
+def _ndjson(records):
+    return b"".join(json.dumps(r).encode() + b"\n" for r in records)
+
+
+# ---------------------------------------------------------------------------
+# NDJSON detection
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("raw, expected", [
+    (b'{"id": 1}\n{"id": 2}\n', True),
+    (b'  {"id": 1}\r\n{"id": 2}', True),
+    (b'{"id": 1}\n\n{"id": 2}\n', True),
+    (b'{"a": 1}', False),
+    (b'{"a": 1}\n', False),
+    (b'{"a": 1}\n \n\n', False),
+    (json.dumps({"a": 1, "b": [1, 2]}, indent=2).encode(), False),
+    (b'[{"id": 1}, {"id": 2}]\n', False),
+    (b'[1]\n[2]\n', False),
+    (b'', False),
+    (b'   \n', False),
+])
+def test_is_ndjson(raw, expected):
+    assert _is_ndjson(raw) is expected
+
+
+def test_load_json_keeps_compact_object_as_dict(loader):
+    _serve_bytes(loader, b'{"a": 1}\n')
+
+    assert loader.load_json_from_gcs("bucket", "obj.json") == {"a": 1}
+
+
+def test_load_json_lines_argument_overrides_detection(loader):
+    _serve_bytes(loader, b'{"id": 1, "name": "a"}\n')
+
+    df = loader.load_json_from_gcs("bucket", "one.json", lines=True)
+
+    assert df.shape == (1, 2)
+
+
+def test_record_loaders_accept_single_record(loader):
+    _serve_bytes(loader, b'{"id": 1, "name": "a"}\n')
+
+    with mock.patch.object(gcs_loader, "get_loader", return_value=loader):
+        df = gcs_loader.load_product_data("bucket", "products.json", destination_path=None)
+
+    assert df.to_dict("records") == [{"id": 1, "name": "a"}]
+
+
+def test_record_loaders_reject_non_records(loader):
+    _serve_bytes(loader, b'"not records"')
+
+    with mock.patch.object(gcs_loader, "get_loader", return_value=loader):
+        with pytest.raises(ValueError, match="list of records"):
+            gcs_loader.load_review_data("bucket", "reviews.json", destination_path=None)
+
+
+def test_ndjson_readers_keep_int_timestamps(loader):
+    data = _ndjson([{"timestamp": 1700000000 + i, "price": 10.0} for i in range(3)])
+    _serve_bytes(loader, data)
+
+    whole = loader.load_json_from_gcs("bucket", "events.json")
+    chunks = list(loader.iter_json_from_gcs("bucket", "events.json", chunksize=2))
+
+    assert whole["timestamp"].tolist() == [1700000000, 1700000001, 1700000002]
+    assert [len(c) for c in chunks] == [2, 1]
+    for chunk in chunks:
+        assert str(chunk["timestamp"].dtype) == "int64[pyarrow]"
+        assert str(chunk["price"].dtype) == "double[pyarrow]"
+
+
+# ---------------------------------------------------------------------------
+# CSV dtype hints
+# ---------------------------------------------------------------------------
+
+def test_arrow_column_types_translates_hints():
+    column_types, remaining = _arrow_column_types({
+        "ticker": "category",
+        "price": np.float32,
+        "qty": "int32",
+        "note": str,
+        "flag": "string",
+        "amount": "float64[pyarrow]",
+        "raw": pa.int16(),
+        "count": "Int64",
+        "grade": pd.CategoricalDtype(["A", "B"]),
+    })
+
+    assert column_types == {
+        "ticker": pa.dictionary(pa.int32(), pa.string()),
+        "price": pa.float32(),
+        "qty": pa.int32(),
+        "note": pa.string(),
+        "flag": pa.string(),
+        "amount": pa.float64(),
+        "raw": pa.int16(),
+    }
+    assert set(remaining) == {"count", "grade"}
+
+
+def test_arrow_column_types_defers_unknown_hints():
+    column_types, remaining = _arrow_column_types({"qty": "bogus"})
+
+    assert column_types == {}
+    assert remaining == {"qty": "bogus"}
+
+
+def test_read_csv_applies_hints_with_arrow_backed_result():
+    csv = b"ticker,price,qty,grade\nA,1.5,3,A\nB,2.5,4,B\nA,3.0,5,A\n"
+
+    df = GCSLoader._read_csv(io.BytesIO(csv), {
+        "ticker": "category",
+        "price": np.float32,
+        "qty": "Int64",
+        "grade": pd.CategoricalDtype(["A", "B"]),
+    })
+
+    assert isinstance(df["ticker"].dtype, pd.CategoricalDtype)
+    assert str(df["price"].dtype) == "float[pyarrow]"
+    assert str(df["qty"].dtype) == "Int64"
+    assert list(df["grade"].cat.categories) == ["A", "B"]
+
+
+def test_chunked_csv_load_is_arrow_backed(loader):
+    _serve_bytes(loader, b"a,b\n1,x\n2,y\n3,z\n")
+
+    df = loader.load_csv_from_gcs("bucket", "data.csv", chunksize=2)
+
+    assert df.dtypes.astype(str).tolist() == ["int64[pyarrow]", "string[pyarrow]"]
+    assert len(df) == 3